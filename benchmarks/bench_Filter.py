@@ -0,0 +1,45 @@
+"""
+Benchmark direct and FFT based FIR filtering in `dspy.Filter`
+
+Prints the runtime of both methods for a range of filter lengths and the
+number of taps above which FFT convolution becomes faster. This number is
+what `Filter.FFT_CROSSOVER` should be set to.
+
+Run as
+
+    python -m benchmarks.bench_Filter
+
+"""
+from __future__ import print_function
+
+import timeit
+import numpy
+from dspy import Filter
+
+
+def bench_firfilter(length=48000 * 10, taps=(8, 16, 32, 48, 64, 96, 128,
+                                              256, 512, 1024, 2048),
+                    repeat=3):
+    data = numpy.random.uniform(-1, 1, length)
+    crossover = None
+
+    print("%8s %12s %12s" % ("taps", "direct [s]", "fft [s]"))
+    for t in taps:
+        b = numpy.random.uniform(-1, 1, t)
+        direct = min(timeit.repeat(
+            lambda: Filter.firfilter(b, data, method='direct'),
+            number=1, repeat=repeat))
+        fft = min(timeit.repeat(
+            lambda: Filter.firfilter(b, data, method='fft'),
+            number=1, repeat=repeat))
+        print("%8d %12.4f %12.4f" % (t, direct, fft))
+
+        if crossover is None and fft < direct:
+            crossover = t
+
+    print("FFT convolution is faster from %s taps on" % crossover)
+    return crossover
+
+
+if __name__ == '__main__':
+    bench_firfilter()
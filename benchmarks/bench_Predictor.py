@@ -0,0 +1,40 @@
+"""
+Benchmark the NumPy/BLAS and numba loops of `dspy.Predictor.rls`
+
+Prints the runtime of both methods for a range of filter orders. The numba
+column is empty if numba is not installed.
+
+Run as
+
+    python -m benchmarks.bench_Predictor
+
+"""
+from __future__ import print_function
+
+import timeit
+import numpy
+from dspy import Predictor
+
+
+def bench_rls(length=48000, orders=(4, 16, 32, 64, 128, 256), repeat=3):
+    x = numpy.random.uniform(-1, 1, length)
+    d = numpy.random.uniform(-1, 1, length)
+    methods = ['numpy']
+    if Predictor.numba is not None:
+        methods.append('numba')
+        # Compile once outside of the measurement
+        Predictor.rls(x[:16], d[:16], 4, 0.99, method='numba')
+
+    print("%8s %12s %12s" % ("order", "numpy [s]", "numba [s]"))
+    for order in orders:
+        times = [
+            min(timeit.repeat(
+                lambda: Predictor.rls(x, d, order, 0.99, method=method),
+                number=1, repeat=repeat))
+            for method in methods
+        ]
+        print("%8d" % order + "".join("%12.4f" % t for t in times))
+
+
+if __name__ == '__main__':
+    bench_rls()
@@ -0,0 +1,303 @@
+"""
+Module to run processing pipelines over many wav files in parallel
+
+"""
+from __future__ import print_function
+
+import os
+import sys
+import ast
+import glob
+import time
+import argparse
+import importlib
+import multiprocessing
+from . import File
+
+# os.rename() does not overwrite existing files on Windows
+_replace = getattr(os, 'replace', os.rename)
+
+
+class Step(object):
+    """
+    Pipeline step calling a function on the signal of a file
+    """
+
+    def __init__(self, func, ratearg=None, outrate=None, **kwargs):
+        """
+        Wrap a function as a pipeline step
+
+        Parameters
+        ----------
+        func : callable
+            Function taking the signal as its first argument and returning
+            the processed signal, such as `Filter.lowpass`.
+        ratearg : string
+            Name of the argument to pass the sampling rate of the file as,
+            e.g. 'fs' for `Filter.lowpass`. Defaults to None.
+        outrate : int
+            Sampling rate of the processed signal, if `func` changes it.
+            Defaults to None.
+        ... : mixed
+            All other named arguments are passed to `func`.
+
+        Notes
+        -----
+
+        * For parallel processing, `func` must be picklable, i.e. defined
+          at module level.
+
+        """
+        self.func = func
+        self.ratearg = ratearg
+        self.outrate = outrate
+        self.kwargs = kwargs
+
+    def __call__(self, rate, data):
+        kwargs = dict(self.kwargs)
+        if self.ratearg is not None:
+            kwargs[self.ratearg] = rate
+
+        data = self.func(data, **kwargs)
+
+        if self.outrate is not None:
+            rate = self.outrate
+        return (rate, data)
+
+
+def run(pattern, outdir, pipeline, workers=None, chunksize=1, force=False,
+        dtype='float64', subtype='int16'):
+    """
+    Read all files matching a pattern, process them and write the results
+
+    Parameters
+    ----------
+    pattern : string
+        Glob pattern of the input wav files, `**` matches directories
+        recursively.
+    outdir : string
+        Output directory. The directory structure below the common
+        directory of all input files is recreated in it.
+    pipeline : list
+        Callables taking and returning a tuple `(rate, data)`, applied in
+        order. See `Step` for wrapping `dspy` functions. Multichannel
+        signals are passed with shape `(channels, frames)`, so that
+        functions process along their default `axis=-1`.
+    workers : int
+        Number of processes. 1 processes all files in the current
+        process. Defaults to the number of CPUs.
+    chunksize : int
+        Number of files handed to a process at once. Defaults to 1.
+    force : boolean
+        Process files even if their output is newer than their input.
+        Defaults to false.
+    dtype : string
+        Data type the files are read as. Defaults to 'float64'.
+    subtype : string
+        Sample format the files are written in. Defaults to 'int16'.
+
+    Returns
+    -------
+    results : list
+        One tuple `(infile, outfile, seconds, error)` per file, in the
+        order they finished. `seconds` is None for skipped files, `error`
+        is None for files that have been processed successfully.
+
+    """
+    infiles = sorted(_glob(pattern))
+    if not infiles:
+        return []
+
+    root = os.path.dirname(os.path.commonprefix(infiles))
+    jobs = [
+        (
+            infile,
+            os.path.join(outdir, os.path.relpath(infile, root)),
+            pipeline, force, dtype, subtype
+        )
+        for infile in infiles
+    ]
+
+    if workers == 1:
+        return [_process(job) for job in jobs]
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        return list(pool.imap_unordered(_process, jobs, chunksize))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _glob(pattern):
+    """
+    Return the files matching a pattern, with `**` matching directories
+    recursively
+
+    """
+    try:
+        return glob.glob(pattern, recursive=True)
+    except TypeError:
+        # Python 2 glob does not support recursive patterns
+        return _walkglob(pattern)
+
+
+def _walkglob(pattern):
+    """
+    Recursive glob walking the directories below the first `**`, see
+    `_glob()`
+
+    """
+    if '**' not in pattern:
+        return glob.glob(pattern)
+
+    base, rest = pattern.split('**', 1)
+    rest = rest.lstrip('/' + os.sep)
+
+    matches = []
+    for dirpath, dirnames, filenames in os.walk(base or os.curdir):
+        matches.extend(glob.glob(os.path.join(dirpath, rest)))
+    return matches
+
+
+def _process(job):
+    """
+    Process a single file, see `run()`
+
+    """
+    infile, outfile, pipeline, force, dtype, subtype = job
+
+    if not force and os.path.exists(outfile) and \
+            os.path.getmtime(outfile) >= os.path.getmtime(infile):
+        return (infile, outfile, None, None)
+
+    start = time.time()
+    try:
+        rate, data = File.wavread(infile, dtype=dtype)
+
+        # Files are read as (frames, channels), dspy functions process
+        # along the last axis
+        data = data.T
+        for step in pipeline:
+            rate, data = step(rate, data)
+        data = data.T
+
+        try:
+            os.makedirs(os.path.dirname(outfile))
+        except OSError:
+            if not os.path.isdir(os.path.dirname(outfile)):
+                raise
+
+        # Write to a temporary file first, so that an interrupted write
+        # does not leave a truncated output that looks up to date
+        tmpfile = os.path.join(
+            os.path.dirname(outfile),
+            '.%s.%d.tmp' % (os.path.basename(outfile), os.getpid())
+        )
+        try:
+            File.wavwrite(tmpfile, rate, data, subtype=subtype)
+            _replace(tmpfile, outfile)
+        except BaseException:
+            if os.path.exists(tmpfile):
+                os.remove(tmpfile)
+            raise
+    except Exception as e:
+        return (infile, outfile, time.time() - start, repr(e))
+
+    return (infile, outfile, time.time() - start, None)
+
+
+def parsestep(function, arguments):
+    """
+    Create a `Step` from its command line representation
+
+    Parameters
+    ----------
+    function : string
+        Name of a `dspy` function, e.g. 'Filter.lowpass'.
+    arguments : list
+        Arguments as `key=value` strings. Values are parsed as Python
+        literals, falling back to strings. The value `rate` passes the
+        sampling rate of the file, the key `outrate` sets the sampling
+        rate of the result.
+
+    Returns
+    -------
+    step : Step
+        The pipeline step
+
+    """
+    module, name = function.rsplit('.', 1)
+    func = getattr(importlib.import_module('dspy.' + module), name)
+
+    kwargs = {}
+    ratearg = None
+    outrate = None
+
+    for argument in arguments:
+        key, value = argument.split('=', 1)
+
+        if value == 'rate':
+            ratearg = key
+            continue
+
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            pass
+
+        if key == 'outrate':
+            outrate = value
+        else:
+            kwargs[key] = value
+
+    return Step(func, ratearg=ratearg, outrate=outrate, **kwargs)
+
+
+def main(argv=None):
+    """
+    Command line entry point, see `--help`
+
+    """
+    parser = argparse.ArgumentParser(
+        description='Process wav files in parallel with dspy functions.',
+        epilog="Example: %(prog)s 'in/**/*.wav' out "
+               "--step Filter.highpass cutoff=100 fs=rate"
+    )
+    parser.add_argument('pattern', help='glob pattern of the input files')
+    parser.add_argument('outdir', help='output directory')
+    parser.add_argument(
+        '--step', nargs='+', action='append', default=[],
+        metavar=('FUNCTION', 'KEY=VALUE'),
+        help='add a pipeline step, e.g. Filter.lowpass cutoff=1000 fs=rate'
+    )
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of processes (default: CPU count)')
+    parser.add_argument('--chunksize', type=int, default=1,
+                        help='files handed to a process at once')
+    parser.add_argument('--force', action='store_true',
+                        help='also process files that are up to date')
+    parser.add_argument('--subtype', default='int16',
+                        help='sample format of the output files')
+    args = parser.parse_args(argv)
+
+    pipeline = [parsestep(step[0], step[1:]) for step in args.step]
+
+    failed = 0
+    for infile, outfile, seconds, error in run(
+            args.pattern, args.outdir, pipeline, workers=args.workers,
+            chunksize=args.chunksize, force=args.force, subtype=args.subtype
+    ):
+        if error is not None:
+            failed += 1
+            print("%8.3fs %s: %s" % (seconds, infile, error), file=sys.stderr)
+        elif seconds is None:
+            print("skipped   %s" % infile)
+        else:
+            print("%8.3fs %s -> %s" % (seconds, infile, outfile))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,9 +5,26 @@ Module to read / write wav files using numpy arrays
 import scipy.io.wavfile as wav
 import numpy
 import warnings
+import struct
 import sys
+import os
+import threading
 
-def wavread(filename):
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# Bits per sample and WAVE format tag of the supported sample formats
+SUBTYPES = {
+    'int16': (16, 1),
+    'int24': (24, 1),
+    'int32': (32, 1),
+    'float32': (32, 3),
+}
+
+
+def wavread(filename, mmap=False, dtype='float64'):
     """
     Return the sample rate (in samples/sec) and data from a WAV file
 
@@ -15,6 +32,12 @@ def wavread(filename):
     ----------
     filename : string
         Input wav file.
+    mmap : boolean
+        Memory-map the file instead of reading it. Defaults to false.
+    dtype : string
+        Data type of the normalized data, e.g. 'float32' or 'float64'.
+        `None` returns the samples as they are stored in the file,
+        without normalization. Defaults to 'float64'.
 
     Returns
     -------
@@ -28,33 +51,152 @@ def wavread(filename):
 
     * The returned sample rate is a Python integer
     * The data is returned as a numpy array of
-      floats, normalized between -1 and 1.
+      floats, normalized between -1 and 1. Unsigned 8 bit samples are
+      centered around 128 and divided by 128.
+    * With `mmap`, the data is returned as a `ScaledView` onto the
+      memory-mapped file, which only reads and normalizes the samples
+      that are being indexed. 24 bit files, which `scipy.io.wavfile`
+      cannot map, are mapped as an `Int24View`.
 
     """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        rate, data = wav.read(filename)
+    mapped = _mapint24(filename) if mmap is True else None
+    if mapped is not None:
+        rate, data = mapped
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            rate, data = wav.read(filename, mmap=mmap)
+
+    if dtype is None:
+        return (rate, data)
+
+    if mmap is True:
+        return (rate, ScaledView(
+            data, _maxvalue(data.dtype), dtype=dtype,
+            offset=_offset(data.dtype)
+        ))
+
+    maxv = _maxvalue(data.dtype)
+    offset = _offset(data.dtype)
+    data = data.astype(dtype)
+    if offset:
+        data -= offset
+    data /= maxv
+    return (rate, data)
+
+
+def wavchunks(filename, framesize=4096, dtype='float32'):
+    """
+    Iterate over a WAV file in chunks of normalized samples
+
+    Parameters
+    ----------
+    filename : string
+        Input wav file.
+    framesize : int
+        Number of samples per chunk. Defaults to 4096.
+    dtype : string
+        Data type of the chunks. Defaults to 'float32'.
+
+    Returns
+    -------
+    data : Generator
+        Generator of numpy arrays, normalized between -1 and 1.
+
+    Notes
+    -----
 
+    * The file is read chunk by chunk, so only the current chunk is held
+      in memory.
+
+    """
+    reader = _RiffReader(filename, dtype=dtype)
     try:
-        maxv = numpy.finfo(data.dtype).max
-    except:
-        maxv = numpy.iinfo(data.dtype).max
+        while True:
+            data = reader.read_frames(framesize)
+            if not len(data):
+                break
+            yield data
+    finally:
+        reader.close()
 
-    return (rate, data.astype('float') / maxv)
 
+def _mapint24(filename):
+    """
+    Memory-map a 24 bit WAV file, see `wavread()`
+
+    Returns
+    -------
+    rate : int
+        Sample rate of wav file
+    data : Int24View
+        The samples, or None if the file does not contain 24 bit samples
 
-def wavwrite(filename, rate, data):
     """
-    Return the sample rate (in samples/sec) and data from a WAV file
+    with open(filename, 'rb') as f:
+        try:
+            tag, channels, rate, blockalign, bits, size = _riffheader(f)
+        except (ValueError, struct.error):
+            # Leave reporting broken files to scipy.io.wavfile
+            return None
+        start = f.tell()
+
+    if tag != 1 or bits != 24:
+        return None
+
+    if size == 0xFFFFFFFF:
+        size = os.path.getsize(filename) - start
+    frames = size // blockalign
+
+    if channels == 1:
+        shape = (frames, 3)
+    else:
+        shape = (frames, channels, 3)
+
+    raw = numpy.memmap(
+        filename, dtype=numpy.uint8, mode='r', offset=start, shape=shape
+    )
+    return (rate, Int24View(raw))
+
+
+def _maxvalue(dtype):
+    """
+    Return the value that samples of a WAV data type are normalized by
+
+    """
+    if numpy.issubdtype(dtype, numpy.floating):
+        return 1.0
+    if dtype == numpy.uint8:
+        return 128
+    return numpy.iinfo(dtype).max
+
+
+def _offset(dtype):
+    """
+    Return the value of silence in a WAV data type, which is subtracted
+    before normalizing
+
+    """
+    if dtype == numpy.uint8:
+        return 128
+    return 0
+
+
+def wavwrite(filename, rate, data, subtype='int16'):
+    """
+    Write a signal to a WAV file
 
     Parameters
     ----------
     filename : string
-        Input wav file.
+        Output wav file.
     rate : int
         Sample rate.
     data : numpy array
         Signal
+    subtype : string
+        Sample format of the file, one of 'int16', 'int24', 'int32' or
+        'float32'. Defaults to 'int16'.
 
     Notes
     -----
@@ -63,62 +205,154 @@ def wavwrite(filename, rate, data):
       floats, normalized between -1 and 1.
 
     """
-    maxv = numpy.iinfo(numpy.int16).max
-    wav.write(filename, rate, (data * maxv).astype('int16'))
+    samples = _encode(data, subtype)
+
+    if subtype == 'int24':
+        channels = 1 if samples.ndim == 2 else samples.shape[1]
+        with open(filename, 'wb') as f:
+            f.write(_wavheader(rate, channels, subtype, samples.shape[0]))
+            f.write(samples.tobytes())
+    else:
+        wav.write(filename, rate, samples)
+
+
+def _encode(data, subtype):
+    """
+    Convert normalized samples to the little-endian representation of a
+    sample format, saturating samples outside of [-1, 1]
+
+    For 'int24' an array of bytes with a last axis of length 3 is returned.
+
+    """
+    if subtype not in SUBTYPES:
+        raise ValueError("subtype must be one of %s" % ", ".join(SUBTYPES))
+
+    data = numpy.asarray(data)
+
+    if subtype == 'float32':
+        return data.astype('<f4', copy=False)
+
+    if subtype == 'int24':
+        dtype, maxv = numpy.dtype('<i4'), 2 ** 23 - 1
+    else:
+        dtype = numpy.dtype(subtype).newbyteorder('<')
+        maxv = numpy.iinfo(dtype).max
+
+    # Scale in double precision, float32 cannot represent 2 ** 31 - 1 and
+    # would overflow on full scale samples. Clip to saturate instead of
+    # wrapping around.
+    scaled = numpy.multiply(data, maxv, dtype=numpy.float64)
+    numpy.clip(scaled, -maxv - 1, maxv, out=scaled)
+    samples = scaled.astype(dtype)
+
+    if subtype == 'int24':
+        return samples[..., numpy.newaxis].view(numpy.uint8)[..., :3]
+    return samples
+
+
+def _wavheader(rate, channels, subtype, frames=None):
+    """
+    Return the RIFF header of a WAV file, including the header of its data
+    chunk
+
+    If the number of frames is unknown, the chunk sizes are set to their
+    maximum, which readers treat as "until the end of the file".
+
+    """
+    bits, tag = SUBTYPES[subtype]
+    blockalign = channels * bits // 8
+
+    if frames is None:
+        riffsize = size = 0xFFFFFFFF
+    else:
+        size = frames * blockalign
+        riffsize = 36 + size
+
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', riffsize, b'WAVE',
+        b'fmt ', 16, tag, channels, rate, rate * blockalign, blockalign, bits,
+        b'data', size
+    )
 
 
 class Stream(object):
     """
-    Interface for streaming audio files through libsndfile
+    Interface for streaming audio files block by block
     """
 
-    def __init__(self, filename, write=False, format='wav', rate=None, channels=None):
+    def __init__(self, filename, write=False, format='wav', rate=None,
+                 channels=None, backend=None, subtype='int16',
+                 dtype='float64', writebehind=0):
         """
         Open audiofile for writing or reading
 
         Parameters
         ----------
         filename : mixed
-            Input wav file. String if a real file, `sys.stdin` for
-            standard in.
+            Input wav file. String if a real file, `sys.stdin` or '-' for
+            standard in, `sys.stdout` or '-' for standard out when writing.
         write: boolean
             Set true for writing to a file
+        format : string
+            File format for writing. Defaults to 'wav'.
         rate : int
             Sample rate. Only required for writing
         channels : int
             Number of Channels. Only required for writing
+        backend : string
+            Either 'riff' for the built-in WAV implementation or
+            'soundfile' to use the `soundfile` package, which supports
+            other formats than WAV. Defaults to 'riff' for WAV files and
+            'soundfile' for all other formats, judging by the file extension
+            when reading.
+        subtype : string
+            Sample format for writing, one of 'int16', 'int24', 'int32' or
+            'float32'. Defaults to 'int16'.
+        dtype : string
+            Data type of the data being read. Defaults to 'float64'.
+        writebehind : int
+            Number of chunks to queue for a background thread writing them
+            to the file, so that computing the next chunk overlaps with
+            writing the last. The queue is flushed by `close()`. 0 writes
+            synchronously. Defaults to 0.
 
         Notes
         -----
 
         * The data is assumed to be a numpy array of
           floats, normalized between -1 and 1.
+        * Multichannel data is of shape `(frames, channels)`.
 
         """
-        try:
-            from scikits.audiolab import Format, Sndfile
-        except:
-            raise RuntimeError('You must have scikits.audiolab installed')
-
-        if filename is sys.stdin:
-            filename = '-'
-
         if write is True and (rate is None or channels is None):
             raise ValueError('You must provide sampling rate and '
                              'number of channels for writing file.')
 
-        if write is False:
-            self.f = Sndfile(filename, 'r')
-
-            self.channels = self.f.channels
-            self.rate = self.f.samplerate
-
+        if backend is None:
+            if write is False and isinstance(filename, str):
+                format = os.path.splitext(filename)[1][1:].lower() or 'wav'
+            backend = 'riff' if format == 'wav' else 'soundfile'
+
+        if backend == 'riff':
+            if format != 'wav':
+                raise ValueError("The riff backend only supports WAV files")
+            if write is False:
+                self.f = _RiffReader(filename, dtype=dtype)
+            else:
+                self.f = _RiffWriter(filename, rate, channels, subtype)
+        elif backend == 'soundfile':
+            self.f = _SoundfileBackend(
+                filename, write, format, rate, channels, subtype, dtype
+            )
         else:
-            format = Format(format)
-            self.f = Sndfile(filename, 'w', format, channels, rate)
+            raise ValueError("backend must be either 'riff' or 'soundfile'")
+
+        if write is True and writebehind > 0:
+            self.f = _WriteBehind(self.f, writebehind)
 
-            self.channels = channels
-            self.rate = rate
+        self.channels = self.f.channels
+        self.rate = self.f.rate
 
     def write(self, data):
         """
@@ -142,14 +376,30 @@ class Stream(object):
         else:
             self.f.write_frames(data)
 
-    def read(self, framesize=1024):
+    def read(self, framesize=1024, overlap=0, last='partial', reuse=False,
+             prefetch=0):
         """
-        Write data to file
+        Read data from file
 
         Parameters
         ----------
         framesize : int
             Number of samples to be read per frame.
+        overlap : int
+            Number of samples consecutive frames have in common. Defaults
+            to 0.
+        last : string
+            What to do with a last frame shorter than `framesize`: 'partial'
+            to return it as it is, 'pad' to pad it with zeros or 'truncate'
+            to drop it. Defaults to 'partial'.
+        reuse : boolean
+            Read all frames into the same array instead of allocating a
+            new one for each frame. Each frame is only valid until the next
+            one is requested. Defaults to false.
+        prefetch : int
+            Number of frames to read ahead in a background thread, so that
+            processing a frame overlaps with reading the next ones. 0 reads
+            synchronously. Defaults to 0.
 
         Returns
         -------
@@ -157,12 +407,598 @@ class Stream(object):
             Generator of numpy arrays that can be iterated over.
 
         """
+        if not 0 <= overlap < framesize:
+            raise ValueError("overlap must be between 0 and framesize")
+        if last not in ('partial', 'pad', 'truncate'):
+            raise ValueError(
+                "last must be one of 'partial', 'pad' or 'truncate'"
+            )
+        if reuse is True and prefetch > 0:
+            raise ValueError("frames cannot be reused when prefetching")
+
+        frames = self._frames(framesize, overlap, last, reuse)
+        if prefetch > 0:
+            return _prefetch(frames, prefetch)
+        return frames
+
+    def _frames(self, framesize, overlap, last, reuse):
+        """
+        Generator behind `read()`
+
+        """
+        hop = framesize - overlap
+        data = self.buffer(framesize)
+        filled = 0
+
+        # close the file also if the consumer stops early
+        try:
+            while True:
+                frames = self.read_into(data[filled:])
+                filled += frames
+
+                if frames == 0:
+                    break
+
+                if filled < framesize:
+                    if last == 'partial':
+                        yield data[:filled]
+                    elif last == 'pad':
+                        data[filled:] = 0
+                        yield data
+                    break
+
+                yield data
+
+                if reuse is True:
+                    data[:overlap] = data[hop:]
+                else:
+                    data, previous = self.buffer(framesize), data
+                    data[:overlap] = previous[hop:]
+                filled = overlap
+        finally:
+            self.close()
+
+    def read_into(self, data):
+        """
+        Read data from file into an existing array
+
+        Parameters
+        ----------
+        data : numpy array
+            C-contiguous array of shape `(frames,)` for mono or
+            `(frames, channels)` for multichannel files, e.g. as created by
+            `buffer()`.
+
+        Returns
+        -------
+        frames : int
+            Number of frames read, 0 at the end of the file.
+
+        """
+        if data.ndim != (1 if self.channels == 1 else 2) or \
+                data.shape[1:] not in ((), (self.channels,)):
+            raise ValueError("data must be of shape (frames, channels)")
+        if not data.flags.c_contiguous:
+            raise ValueError("data must be C-contiguous")
+
+        return self.f.read_frames_into(data)
+
+    def buffer(self, framesize=1024):
+        """
+        Allocate an array that `read_into()` can read into
+
+        Parameters
+        ----------
+        framesize : int
+            Number of samples per frame.
+
+        Returns
+        -------
+        data : numpy array
+            Uninitialized array.
+
+        """
+        if self.channels == 1:
+            shape = (framesize,)
+        else:
+            shape = (framesize, self.channels)
+        return numpy.empty(shape, dtype=self.f.dtype)
+
+    def seek(self, frame):
+        """
+        Move to a position in the file
+
+        Parameters
+        ----------
+        frame : int
+            Number of the frame to read next.
+
+        """
+        self.f.seek(frame)
+
+    def close(self):
+        """
+        Close the file, completing its header if it has been written to
+
+        """
+        self.f.close()
+
+
+def _prefetch(generator, size):
+    """
+    Run a generator in a background thread, buffering up to `size` of its
+    values in a queue
+
+    """
+    frames = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    end = object()
+
+    def produce():
+        try:
+            for frame in generator:
+                frames.put((frame, None))
+                if stop.is_set():
+                    return
+            frames.put((end, None))
+        except Exception as e:
+            frames.put((end, e))
+        finally:
+            # runs the cleanup of the generator, e.g. closing its file
+            generator.close()
+
+    worker = threading.Thread(target=produce)
+    worker.daemon = True
+    worker.start()
+
+    try:
         while True:
+            frame, error = frames.get()
+            if error is not None:
+                raise error
+            if frame is end:
+                break
+            yield frame
+    finally:
+        # unblock the worker if the consumer stopped early
+        stop.set()
+        while worker.is_alive():
             try:
-                yield self.f.read_frames(framesize)
-            except RuntimeError:
-                self.close()
-                raise StopIteration
+                frames.get(timeout=0.01)
+            except queue.Empty:
+                pass
+
+
+class _WriteBehind(object):
+    """
+    Backend wrapper that writes chunks in a background thread
+    """
+
+    def __init__(self, f, size):
+        self.f = f
+        self.channels = f.channels
+        self.rate = f.rate
+        self.chunks = queue.Queue(maxsize=size)
+        self.error = None
+        self.worker = threading.Thread(target=self._consume)
+        self.worker.daemon = True
+        self.worker.start()
+
+    def _consume(self):
+        while True:
+            data = self.chunks.get()
+            if data is None:
+                return
+            if self.error is None:
+                try:
+                    self.f.write_frames(data)
+                except Exception as e:
+                    self.error = e
+
+    def _raise(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def write_frames(self, data):
+        self._raise()
+        # copy, as the caller may reuse its array for the next chunk
+        self.chunks.put(numpy.array(data))
+
+    def seek(self, frame):
+        raise IOError("Seeking is not supported when writing")
+
+    def close(self):
+        if self.worker.is_alive():
+            self.chunks.put(None)
+            self.worker.join()
+        self.f.close()
+        self._raise()
+
+
+def _open(filename, mode):
+    """
+    Open a file in binary mode, mapping '-' to standard in or out
+
+    Returns the file and whether it must be closed by the caller.
+
+    """
+    if filename == '-':
+        filename = sys.stdin if 'r' in mode else sys.stdout
+
+    if filename is sys.stdin or filename is sys.stdout:
+        return (getattr(filename, 'buffer', filename), False)
+
+    return (open(filename, mode), True)
+
+
+def _seekable(f):
+    """
+    Return whether a file supports seeking
+
+    """
+    try:
+        return f.seekable()
+    except AttributeError:
+        try:
+            f.tell()
+            return True
+        except IOError:
+            return False
+
+
+def _riffheader(f):
+    """
+    Parse the header of a WAV file up to the start of its data chunk
+
+    Returns
+    -------
+    tag : int
+        Format tag, 1 for integer and 3 for floating point samples
+    channels : int
+        Number of channels
+    rate : int
+        Sample rate
+    blockalign : int
+        Number of bytes per frame
+    bits : int
+        Number of bits per sample
+    size : int
+        Size of the data chunk in bytes
+
+    """
+    riff, size, wave = struct.unpack('<4sI4s', f.read(12))
+    if riff != b'RIFF' or wave != b'WAVE':
+        raise ValueError("Not a RIFF WAV file")
+
+    fmt = None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("WAV file has no data chunk")
+
+        chunk, size = struct.unpack('<4sI', header)
+        if chunk == b'fmt ':
+            fmt = f.read(size + size % 2)
+        elif chunk == b'data':
+            break
+        elif _seekable(f):
+            f.seek(size + size % 2, 1)
+        else:
+            f.read(size + size % 2)
+
+    if fmt is None:
+        raise ValueError("WAV file has no fmt chunk")
+
+    tag, channels, rate, _, blockalign, bits = \
+        struct.unpack('<HHIIHH', fmt[:16])
+    if tag == 0xFFFE:
+        tag, = struct.unpack('<H', fmt[24:26])
+
+    return (tag, channels, rate, blockalign, bits, size)
+
+
+class _RiffReader(object):
+    """
+    Built-in streaming reader for RIFF WAV files
+    """
+
+    def __init__(self, filename, dtype='float64'):
+        self.f, self.owned = _open(filename, 'rb')
+        self.dtype = numpy.dtype(dtype)
+
+        tag, self.channels, self.rate, self.blockalign, self.bits, size = \
+            _riffheader(self.f)
+
+        if tag == 1 and self.bits in (8, 16, 24, 32):
+            self.float = False
+        elif tag == 3 and self.bits in (32, 64):
+            self.float = True
+        else:
+            raise ValueError(
+                "Unsupported WAV format %d with %d bits" % (tag, self.bits)
+            )
+
+        self.seekable = _seekable(self.f)
+        self.start = self.f.tell() if self.seekable else None
+        self.frames = None if size == 0xFFFFFFFF else size // self.blockalign
+        self.position = 0
+        self.raw = bytearray()
+        self.wide = numpy.zeros((0, 4), dtype=numpy.uint8)
+
+    def read_frames(self, frames):
+        if self.frames is not None:
+            frames = max(0, min(frames, self.frames - self.position))
+
+        if self.channels == 1:
+            data = numpy.empty(frames, dtype=self.dtype)
+        else:
+            data = numpy.empty((frames, self.channels), dtype=self.dtype)
+
+        return data[:self.read_frames_into(data)]
+
+    def read_frames_into(self, data):
+        frames = len(data)
+        if self.frames is not None:
+            frames = max(0, min(frames, self.frames - self.position))
+
+        size = frames * self.blockalign
+        if len(self.raw) < size:
+            self.raw = bytearray(size)
+        raw = memoryview(self.raw)[:size]
+
+        # unlike read(), readinto() may return early on pipes
+        received = 0
+        while received < size:
+            chunk = self.f.readinto(raw[received:])
+            if not chunk:
+                break
+            received += chunk
+
+        frames = received // self.blockalign
+        self.position += frames
+
+        self._decode(
+            raw[:frames * self.blockalign], data[:frames].reshape(-1)
+        )
+        return frames
+
+    def _decode(self, raw, data):
+        """
+        Convert raw little-endian samples to normalized floats, writing
+        them into a flat output array
+
+        """
+        if self.float:
+            data[:] = numpy.frombuffer(raw, dtype='<f%d' % (self.bits // 8))
+            return
+
+        if self.bits == 8:
+            data[:] = numpy.frombuffer(raw, dtype=numpy.uint8)
+            data -= 128
+            data /= 128
+            return
+
+        if self.bits == 24:
+            # left-justify 24 bit samples in 32 bit integers
+            if len(self.wide) < len(data):
+                self.wide = numpy.zeros((len(data), 4), dtype=numpy.uint8)
+            samples = self.wide[:len(data)]
+            samples[:, 1:] = numpy.frombuffer(
+                raw, dtype=numpy.uint8
+            ).reshape(-1, 3)
+            samples = samples.view('<i4')[:, 0]
+        else:
+            samples = numpy.frombuffer(raw, dtype='<i%d' % (self.bits // 8))
+
+        numpy.divide(samples, _maxvalue(samples.dtype), out=data)
+
+    def seek(self, frame):
+        if not self.seekable:
+            raise IOError("File is not seekable")
+        self.f.seek(self.start + frame * self.blockalign)
+        self.position = frame
+
+    def close(self):
+        if self.owned:
+            self.f.close()
+
+
+class _RiffWriter(object):
+    """
+    Built-in streaming writer for RIFF WAV files
+    """
+
+    def __init__(self, filename, rate, channels, subtype='int16'):
+        if subtype not in SUBTYPES:
+            raise ValueError("subtype must be one of %s" % ", ".join(SUBTYPES))
+
+        self.f, self.owned = _open(filename, 'wb')
+        self.rate = rate
+        self.channels = channels
+        self.subtype = subtype
+        self.frames = 0
+        self.f.write(_wavheader(rate, channels, subtype))
+
+    def write_frames(self, data):
+        samples = _encode(data, self.subtype)
+        self.f.write(samples.tobytes())
+        self.frames += samples.shape[0]
+
+    def seek(self, frame):
+        raise IOError("Seeking is not supported when writing")
+
+    def close(self):
+        if self.f.closed:
+            return
+
+        # fix up the chunk sizes now that the length is known
+        if _seekable(self.f):
+            header = _wavheader(
+                self.rate, self.channels, self.subtype, self.frames
+            )
+            self.f.seek(0)
+            self.f.write(header)
+            self.f.seek(0, 2)
+
+        if self.owned:
+            self.f.close()
+        else:
+            self.f.flush()
+
+
+class _SoundfileBackend(object):
+    """
+    Streaming reader and writer using the `soundfile` package
+    """
+
+    def __init__(self, filename, write, format, rate, channels, subtype,
+                 dtype):
+        try:
+            import soundfile
+        except ImportError:
+            raise RuntimeError('You must have soundfile installed')
+
+        if filename is sys.stdin or filename is sys.stdout:
+            filename = getattr(filename, 'buffer', filename)
+
+        self.dtype = numpy.dtype(dtype)
+
+        if write is False:
+            self.f = soundfile.SoundFile(filename, 'r')
+        else:
+            self.f = soundfile.SoundFile(
+                filename, 'w', samplerate=rate, channels=channels,
+                format=format.upper(), subtype={
+                    'int16': 'PCM_16',
+                    'int24': 'PCM_24',
+                    'int32': 'PCM_32',
+                    'float32': 'FLOAT',
+                }[subtype]
+            )
+
+        self.channels = self.f.channels
+        self.rate = self.f.samplerate
+
+    def read_frames(self, frames):
+        return self.f.read(frames, dtype=self.dtype)
+
+    def read_frames_into(self, data):
+        return len(self.f.read(out=data))
+
+    def write_frames(self, data):
+        self.f.write(data)
+
+    def seek(self, frame):
+        self.f.seek(frame)
 
     def close(self):
         self.f.close()
+
+
+class Int24View(object):
+    """
+    Read-only view of raw 24 bit samples that converts them to 32 bit
+    integers on access
+    """
+
+    dtype = numpy.dtype(numpy.int32)
+
+    def __init__(self, raw):
+        """
+        Wrap an array
+
+        Parameters
+        ----------
+        raw : numpy array
+            The underlying bytes, e.g. a memory-mapped file, with a last
+            axis of length 3 holding the little-endian bytes of each
+            sample.
+
+        Notes
+        -----
+
+        * Samples are left-justified in 32 bits, just like
+          `scipy.io.wavfile` reads 24 bit files.
+
+        """
+        self.raw = raw
+
+    @property
+    def shape(self):
+        return self.raw.shape[:-1]
+
+    @property
+    def ndim(self):
+        return self.raw.ndim - 1
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        raw = self.raw[key + (slice(None),)]
+
+        wide = numpy.zeros(raw.shape[:-1] + (4,), dtype=numpy.uint8)
+        wide[..., 1:] = raw
+        return wide.view('<i4')[..., 0]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[...]
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        return data
+
+
+class ScaledView(object):
+    """
+    Read-only view of an array that normalizes its values on access
+    """
+
+    def __init__(self, data, maxv, dtype='float64', offset=0):
+        """
+        Wrap an array
+
+        Parameters
+        ----------
+        data : numpy array
+            The underlying array, e.g. a memory-mapped file.
+        maxv : float
+            Value to divide values by.
+        dtype : string
+            Data type of the normalized values. Defaults to 'float64'.
+        offset : float
+            Value to subtract before dividing, e.g. 128 for unsigned 8 bit
+            samples. Defaults to 0.
+
+        """
+        self.data = data
+        self.maxv = maxv
+        self.dtype = numpy.dtype(dtype)
+        self.offset = offset
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def ndim(self):
+        return self.data.ndim
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        if not self.offset:
+            return numpy.divide(self.data[key], self.maxv, dtype=self.dtype)
+
+        data = numpy.subtract(self.data[key], self.offset, dtype=self.dtype)
+        data /= self.maxv
+        return data
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[...]
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        return data
@@ -3,11 +3,29 @@ Module to filter audio signals using numpy arrays
 
 """
 import scipy.signal
+import scipy.ndimage
 import numpy
+import threading
+import collections
 from . import Transform
 
+try:
+    from math import gcd
+except ImportError:
+    from fractions import gcd
 
-def lowpass(data, cutoff, fs, coeffs=61, window='hanning', unshift=False):
+try:
+    from scipy.fft import next_fast_len
+except ImportError:
+    from scipy.fftpack import next_fast_len
+
+# Number of FIR taps above which method='auto' switches to FFT convolution.
+# See benchmarks/bench_Filter.py for how this value was obtained.
+FFT_CROSSOVER = 128
+
+
+def lowpass(data, cutoff, fs, coeffs=61, window='hann', unshift=False,
+            method='auto', axis=-1):
     """
     Filter a signal with a lowpass
 
@@ -22,9 +40,16 @@ def lowpass(data, cutoff, fs, coeffs=61, window='hanning', unshift=False):
     coeffs : int
         Coefficients. Defaults to 61.
     window : string
-        Filter window to be used. Defaults to 'hanning'.
+        Filter window to be used. Defaults to 'hann'.
     unshift : boolean
         Unshift result by filter delay. Defaults to false.
+    method : string
+        Either 'direct' to use `scipy.signal.lfilter()`, 'fft' to use
+        overlap-add FFT convolution or 'auto' to choose depending on the
+        number of coefficients and length of the signal. Defaults to
+        'auto'.
+    axis : int
+        The axis to filter along. Defaults to -1.
 
     Returns
     -------
@@ -32,17 +57,17 @@ def lowpass(data, cutoff, fs, coeffs=61, window='hanning', unshift=False):
         The filtered signal
 
     """
-    taps = scipy.signal.firwin(coeffs,
-                               cutoff / (float(fs) / 2.0), window=window)
-    data = scipy.signal.lfilter(taps, 1.0, data)
+    b, a = designlowpass(cutoff, fs, coeffs=coeffs, window=window)
+    data = firfilter(b, data, method=method, axis=axis)
 
     if unshift is True:
-        return numpy.roll(data, -coeffs // 2)
+        return numpy.roll(data, -coeffs // 2, axis=axis)
     else:
         return data
 
 
-def highpass(data, cutoff, fs, coeffs=61, window='hanning', unshift=False):
+def highpass(data, cutoff, fs, coeffs=61, window='hann', unshift=False,
+             method='auto', axis=-1):
     """
     Filter a signal with a highpass
 
@@ -55,11 +80,18 @@ def highpass(data, cutoff, fs, coeffs=61, window='hanning', unshift=False):
     fs : int
         Sampling rate.
     coeffs : int
-        Coefficients. Defaults to 61.
+        Coefficients. Must be odd. Defaults to 61.
     window : string
-        Filter window to be used. Defaults to 'hanning'.
+        Filter window to be used. Defaults to 'hann'.
     unshift : boolean
         Unshift result by filter delay. Defaults to false.
+    method : string
+        Either 'direct' to use `scipy.signal.lfilter()`, 'fft' to use
+        overlap-add FFT convolution or 'auto' to choose depending on the
+        number of coefficients and length of the signal. Defaults to
+        'auto'.
+    axis : int
+        The axis to filter along. Defaults to -1.
 
     Returns
     -------
@@ -67,19 +99,17 @@ def highpass(data, cutoff, fs, coeffs=61, window='hanning', unshift=False):
         The filtered signal
 
     """
-    taps = scipy.signal.firwin(coeffs,
-                               cutoff / (float(fs) / 2.0), window=window)
-    taps = -taps
-    taps[coeffs / 2] = taps[coeffs / 2] + 1
-    data = scipy.signal.lfilter(taps, 1.0, data)
+    b, a = designhighpass(cutoff, fs, coeffs=coeffs, window=window)
+    data = firfilter(b, data, method=method, axis=axis)
 
     if unshift is True:
-        return numpy.roll(data, -coeffs // 2)
+        return numpy.roll(data, -coeffs // 2, axis=axis)
     else:
         return data
 
 
-def bandpass(data, cutoff_low, cutoff_high, fs, order=9, **kwargs):
+def bandpass(data, cutoff_low, cutoff_high, fs, order=9, output='ba',
+             zerophase=False, axis=-1, **kwargs):
     """
     Filter a signal with a bandpass
 
@@ -95,8 +125,18 @@ def bandpass(data, cutoff_low, cutoff_high, fs, order=9, **kwargs):
         Sampling rate.
     order : int
         Order of filter. Defaults to 9.
+    output : string
+        Filter representation, either 'ba' for transfer function
+        coefficients or 'sos' for second-order sections. Second-order
+        sections remain numerically stable at high orders and narrow
+        bands. Defaults to 'ba'.
+    zerophase : boolean
+        Filter forwards and backwards, resulting in zero phase shift and
+        squared magnitude response. Defaults to false.
+    axis : int
+        The axis to filter along. Defaults to -1.
     window : string
-        Filter window to be used. Defaults to 'hanning'.
+        Filter window to be used. Defaults to 'hann'.
     unshift : boolean
         Unshift result by filter delay. Defaults to false.
 
@@ -106,14 +146,260 @@ def bandpass(data, cutoff_low, cutoff_high, fs, order=9, **kwargs):
         The filtered signal
 
     """
-    b, a = scipy.signal.butter(
-        order,
-        [cutoff_low / (float(fs) / 2.0), cutoff_high / (float(fs) / 2.0)],
-        btype='band')
-    return scipy.signal.lfilter(b, a, data)
+    if output == 'sos':
+        # sosfilt() refuses read-only arrays, so copy the cached design
+        sos = numpy.array(designbandpass(
+            cutoff_low, cutoff_high, fs, order=order, output='sos'
+        ))
+        if zerophase is True:
+            return scipy.signal.sosfiltfilt(sos, data, axis=axis)
+        else:
+            return scipy.signal.sosfilt(sos, data, axis=axis)
+    elif output == 'ba':
+        b, a = designbandpass(cutoff_low, cutoff_high, fs, order=order)
+        if zerophase is True:
+            return scipy.signal.filtfilt(b, a, data, axis=axis)
+        else:
+            return scipy.signal.lfilter(b, a, data, axis=axis)
+    else:
+        raise ValueError("output must be either 'ba' or 'sos'")
+
+
+def designlowpass(cutoff, fs, coeffs=61, window='hann'):
+    """
+    Design a windowed FIR lowpass
+
+    Parameters
+    ----------
+    cutoff : int
+        Cutoff frequency.
+    fs : int
+        Sampling rate.
+    coeffs : int
+        Coefficients. Defaults to 61.
+    window : string
+        Filter window to be used. Defaults to 'hann'.
+
+    Returns
+    -------
+    b : numpy array
+        Numerator coefficients (the filter taps).
+    a : numpy array
+        Denominator coefficients.
+
+    Notes
+    -----
+
+    * Designs are cached in `designcache`, the returned arrays are
+      read-only.
+
+    """
+    def design():
+        b = scipy.signal.firwin(coeffs,
+                                cutoff / (float(fs) / 2.0), window=window)
+        return (b, numpy.ones(1))
+
+    return designcache.get(('lowpass', cutoff, fs, coeffs, window), design)
+
+
+def designhighpass(cutoff, fs, coeffs=61, window='hann'):
+    """
+    Design a windowed FIR highpass by spectral inversion of a lowpass
+
+    Parameters
+    ----------
+    cutoff : int
+        Cutoff frequency.
+    fs : int
+        Sampling rate.
+    coeffs : int
+        Coefficients. Must be odd. Defaults to 61.
+    window : string
+        Filter window to be used. Defaults to 'hann'.
+
+    Returns
+    -------
+    b : numpy array
+        Numerator coefficients (the filter taps).
+    a : numpy array
+        Denominator coefficients.
+
+    Notes
+    -----
+
+    * Designs are cached in `designcache`, the returned arrays are
+      read-only.
+
+    """
+    if coeffs % 2 == 0:
+        raise ValueError("coeffs must be odd for a highpass")
+
+    def design():
+        b, a = designlowpass(cutoff, fs, coeffs=coeffs, window=window)
+        b = -b
+        b[coeffs // 2] = b[coeffs // 2] + 1
+        return (b, a)
+
+    return designcache.get(('highpass', cutoff, fs, coeffs, window), design)
 
 
-def medianlimiter(data, size=11, weight=1):
+def designbandpass(cutoff_low, cutoff_high, fs, order=9, output='ba'):
+    """
+    Design a Butterworth bandpass
+
+    Parameters
+    ----------
+    cutoff_low : int
+        Lower end cutoff frequency.
+    cutoff_high : int
+        Upper end cutoff frequency.
+    fs : int
+        Sampling rate.
+    order : int
+        Order of filter. Defaults to 9.
+    output : string
+        Filter representation, either 'ba' or 'sos'. Defaults to 'ba'.
+
+    Returns
+    -------
+    b : numpy array
+        Numerator coefficients.
+    a : numpy array
+        Denominator coefficients.
+    sos : numpy array
+        Second-order sections, returned instead of `b` and `a` if
+        `output` is 'sos'.
+
+    Notes
+    -----
+
+    * Designs are cached in `designcache`, the returned arrays are
+      read-only.
+
+    """
+    def design():
+        return scipy.signal.butter(
+            order,
+            [cutoff_low / (float(fs) / 2.0), cutoff_high / (float(fs) / 2.0)],
+            btype='band', output=output)
+
+    return designcache.get(
+        ('bandpass', cutoff_low, cutoff_high, fs, order, output), design
+    )
+
+
+def firfilter(b, data, method='auto', axis=-1):
+    """
+    Filter a signal with an FIR filter
+
+    Parameters
+    ----------
+    b : numpy array
+        The filter taps.
+    data : numpy array
+        Input signal.
+    method : string
+        Either 'direct' to use `scipy.signal.lfilter()`, 'fft' to use
+        `fftfilt()` or 'auto' to choose depending on the number of taps
+        and length of the signal. Defaults to 'auto'.
+    axis : int
+        The axis to filter along. Defaults to -1.
+
+    Returns
+    -------
+    data : numpy array
+        The filtered signal
+
+    Notes
+    -----
+
+    * 'auto' uses FFT convolution if the filter has more than
+      `FFT_CROSSOVER` taps and the signal is longer than the filter.
+
+    """
+    data = numpy.asarray(data)
+
+    if method == 'auto':
+        if len(b) > FFT_CROSSOVER and data.shape[axis] > len(b):
+            method = 'fft'
+        else:
+            method = 'direct'
+
+    if method == 'fft':
+        return fftfilt(b, data, axis=axis)
+    elif method == 'direct':
+        return scipy.signal.lfilter(b, 1.0, data, axis=axis)
+    else:
+        raise ValueError("method must be one of 'auto', 'fft' or 'direct'")
+
+
+def fftfilt(b, data, nfft=None, axis=-1):
+    """
+    Filter a signal with an FIR filter using overlap-add FFT convolution
+
+    Parameters
+    ----------
+    b : numpy array
+        The filter taps.
+    data : numpy array
+        Input signal.
+    nfft : int
+        FFT length. Must be larger than the number of taps. Defaults to a
+        fast length of at least four times the number of taps.
+    axis : int
+        The axis to filter along. Defaults to -1.
+
+    Returns
+    -------
+    data : numpy array
+        The filtered signal, equal to `scipy.signal.lfilter(b, 1, data)`
+        up to numerical precision
+
+    """
+    data = numpy.moveaxis(numpy.asarray(data), axis, -1)
+    out = _overlapadd(b, data, nfft)[..., :data.shape[-1]]
+    return numpy.moveaxis(out, -1, axis)
+
+
+def _overlapadd(b, data, nfft=None):
+    """
+    Full linear convolution of `data` with `b` along the last axis using
+    overlap-add, of length `data.shape[-1] + len(b) - 1`
+
+    """
+    b = numpy.asarray(b)
+    data = numpy.asarray(data)
+    taps = len(b)
+    length = data.shape[-1]
+
+    if nfft is None:
+        nfft = min(max(4 * taps, 1024), length + taps - 1)
+        nfft = next_fast_len(max(nfft, taps))
+    if not nfft > taps - 1:
+        raise ValueError("nfft must be larger than the number of taps")
+
+    if numpy.iscomplexobj(b) or numpy.iscomplexobj(data):
+        fft, ifft = numpy.fft.fft, numpy.fft.ifft
+    else:
+        fft, ifft = numpy.fft.rfft, numpy.fft.irfft
+
+    step = nfft - taps + 1
+    B = fft(b, nfft)
+    out = numpy.zeros(
+        data.shape[:-1] + (length + taps - 1,),
+        dtype=numpy.result_type(b, data, 1.0)
+    )
+
+    for start in range(0, length, step):
+        block = data[..., start:start + step]
+        size = block.shape[-1] + taps - 1
+        y = ifft(fft(block, nfft) * B, nfft)
+        out[..., start:start + size] += y[..., :size]
+
+    return out
+
+
+def medianlimiter(data, size=11, weight=1, method='ndimage', axis=-1):
     """
     Limit a signal with a sliding median window.
 
@@ -129,23 +415,43 @@ def medianlimiter(data, size=11, weight=1):
         Size of the sliding window. Defaults to 11.
     weight : int
         Weighting coefficient for the median window. Defaults to 1.
+    method : string
+        Either 'ndimage' to calculate the running median using
+        `scipy.ndimage`, or 'window' to take the median of a sliding window
+        matrix. Defaults to 'ndimage'.
+    axis : int
+        The axis to filter along. Defaults to -1.
 
     Returns
     -------
     data : numpy array
         The filtered signal.
 
+    Notes
+    -----
+
+    * Samples that are exactly zero stay zero.
+
     """
-    return data / numpy.abs(data) * numpy.minimum(
-        numpy.abs(data),
-        weight * numpy.median(
-            Transform.slidingwindow(numpy.abs(data), size=size),
-            axis=1
-        )
-    )
+    magnitude = numpy.abs(data)
+
+    if method == 'ndimage':
+        median = runningmedian(magnitude, size=size, axis=axis)
+    elif method == 'window':
+        median = numpy.moveaxis(numpy.median(
+            Transform.slidingwindow(magnitude, size=size, axis=axis),
+            axis=-1
+        ), -1, axis)
+    else:
+        raise ValueError("method must be either 'ndimage' or 'window'")
 
+    sign = numpy.zeros(data.shape, dtype=numpy.result_type(data, 1.0))
+    numpy.divide(data, magnitude, out=sign, where=magnitude != 0)
 
-def localaveragecompensation(data, size=11):
+    return sign * numpy.minimum(magnitude, weight * median)
+
+
+def localaveragecompensation(data, size=11, method='ndimage', axis=-1):
     """
     Compensate local average of a signal.
 
@@ -159,6 +465,12 @@ def localaveragecompensation(data, size=11):
         Input signal.
     size : int
         Size of the sliding window. Defaults to 11.
+    method : string
+        Either 'ndimage' to calculate the running average with
+        `scipy.ndimage` in O(n), or 'window' to average a sliding window
+        matrix in O(n * size). Defaults to 'ndimage'.
+    axis : int
+        The axis to filter along. Defaults to -1.
 
     Returns
     -------
@@ -166,13 +478,111 @@ def localaveragecompensation(data, size=11):
         The filtered signal.
 
     """
-    return data - numpy.average(
-        Transform.slidingwindow(numpy.abs(data), size=size),
-        axis=1
+    if method == 'ndimage':
+        average = runningmean(numpy.abs(data), size=size, axis=axis)
+    elif method == 'window':
+        average = numpy.moveaxis(numpy.average(
+            Transform.slidingwindow(numpy.abs(data), size=size, axis=axis),
+            axis=-1
+        ), -1, axis)
+    else:
+        raise ValueError("method must be either 'ndimage' or 'window'")
+
+    return data - average
+
+
+def runningmean(data, size=11, axis=-1):
+    """
+    Calculate the centered running mean of a signal.
+
+    Parameters
+    ----------
+    data : numpy array
+        Input signal.
+    size : int
+        Size of the sliding window. Defaults to 11.
+    axis : int
+        The axis to filter along. Defaults to -1.
+
+    Returns
+    -------
+    data : numpy array
+        The running mean, of same shape as the input signal.
+
+    Notes
+    -----
+
+    * The signal is edge-padded just like `Transform.slidingwindow()`
+      does, so the result equals averaging its windows.
+    * The mean is calculated by `scipy.ndimage.uniform_filter1d()`, which
+      updates a running sum. It takes O(n) time regardless of the window
+      size and needs no memory besides the result.
+
+    """
+    if not size > 0:
+        raise ValueError("size must be greater than zero")
+
+    data = numpy.asarray(data, dtype=numpy.result_type(data, 1.0))
+    return scipy.ndimage.uniform_filter1d(
+        data, size, axis=axis, mode='nearest'
     )
 
 
-def resample(data, datafs, targetfs):
+def runningmedian(data, size=11, axis=-1):
+    """
+    Calculate the centered running median of a signal.
+
+    Parameters
+    ----------
+    data : numpy array
+        Input signal.
+    size : int
+        Size of the sliding window. Defaults to 11.
+    axis : int
+        The axis to filter along. Defaults to -1.
+
+    Returns
+    -------
+    data : numpy array
+        The running median, of same shape as the input signal.
+
+    Notes
+    -----
+
+    * The signal is edge-padded just like `Transform.slidingwindow()`
+      does, so the result equals the median of its windows.
+    * The median is calculated by `scipy.ndimage.median_filter()`, which
+      only keeps the current window in memory. For even window sizes,
+      the two middle ranks are averaged.
+    * Multidimensional signals are filtered one row at a time, as
+      `scipy.ndimage` is much slower on windows spanning several axes.
+
+    """
+    if not size > 0:
+        raise ValueError("size must be greater than zero")
+
+    data = numpy.moveaxis(
+        numpy.asarray(data, dtype=numpy.result_type(data, 1.0)), axis, -1
+    )
+    shape = data.shape
+    # ndimage only uses its fast running median on one-dimensional input,
+    # so filter each row on its own
+    rows = data.reshape(-1, shape[-1])
+    median = numpy.empty_like(rows)
+
+    for row, out in zip(rows, median):
+        scipy.ndimage.median_filter(row, size=size, mode='nearest', output=out)
+
+        if size % 2 == 0:
+            out += scipy.ndimage.rank_filter(
+                row, size // 2 - 1, size=size, mode='nearest'
+            )
+            out /= 2.0
+
+    return numpy.moveaxis(median.reshape(shape), -1, axis)
+
+
+def resample(data, datafs, targetfs, method='fft', axis=-1):
     """
     Resample signal from one sampling frequency to another.
 
@@ -184,14 +594,497 @@ def resample(data, datafs, targetfs):
         Sampling frequency of input signal.
     targetfs : int
         Desired output sampling frequency.
+    method : string
+        Either 'fft' to resample in the frequency domain using
+        `scipy.signal.resample()`, or 'polyphase' to use a polyphase FIR
+        filter via `scipy.signal.resample_poly()`. Defaults to 'fft'.
+    axis : int
+        The axis to resample along. Defaults to -1.
 
     Returns
     -------
     data : numpy array
         The resampled signal.
 
+    Notes
+    -----
+
+    * The polyphase method is much faster for rational ratios of small
+      integers such as 44100 / 48000, especially for signal lengths that
+      are prime. Its output may be one sample longer than that of 'fft'.
+
     """
-    return scipy.signal.resample(
-        data,
-        int((len(data) / float(datafs)) * float(targetfs))
-    )
+    data = numpy.asarray(data)
+
+    if method == 'fft':
+        return scipy.signal.resample(
+            data,
+            int((data.shape[axis] / float(datafs)) * float(targetfs)),
+            axis=axis
+        )
+    elif method == 'polyphase':
+        up, down = resampleratio(datafs, targetfs)
+        return scipy.signal.resample_poly(
+            data, up, down, window=designresample(up, down), axis=axis
+        )
+    else:
+        raise ValueError("method must be either 'fft' or 'polyphase'")
+
+
+def resampleratio(datafs, targetfs):
+    """
+    Calculate the integer up- and downsampling factors between two
+    sampling frequencies
+
+    Parameters
+    ----------
+    datafs : int
+        Sampling frequency of input signal.
+    targetfs : int
+        Desired output sampling frequency.
+
+    Returns
+    -------
+    up : int
+        Upsampling factor.
+    down : int
+        Downsampling factor.
+
+    """
+    datafs, targetfs = int(datafs), int(targetfs)
+    divisor = gcd(datafs, targetfs)
+    return (targetfs // divisor, datafs // divisor)
+
+
+def designresample(up, down):
+    """
+    Design the anti-aliasing lowpass for polyphase resampling
+
+    Parameters
+    ----------
+    up : int
+        Upsampling factor.
+    down : int
+        Downsampling factor.
+
+    Returns
+    -------
+    b : numpy array
+        The filter taps, the same `scipy.signal.resample_poly()` would use
+        by default.
+
+    Notes
+    -----
+
+    * Designs are cached in `designcache`, the returned array is
+      read-only.
+
+    """
+    def design():
+        rate = max(up, down)
+        return scipy.signal.firwin(
+            2 * 10 * rate + 1, 1.0 / rate, window=('kaiser', 5.0)
+        )
+
+    return designcache.get(('resample', up, down), design)
+
+
+class DesignCache(object):
+    """
+    Thread-safe least recently used cache for filter designs
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Create empty cache
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of designs to be kept. Defaults to 128.
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._designs = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, design):
+        """
+        Return a cached design, or create and cache it
+
+        Parameters
+        ----------
+        key : tuple
+            The design parameters.
+        design : callable
+            Function creating the design when it is not cached yet. Must
+            return a numpy array or tuple of numpy arrays.
+
+        Returns
+        -------
+        data : mixed
+            The design, with all arrays made read-only
+
+        Notes
+        -----
+
+        * Designs with unhashable parameters are created, but not cached.
+
+        """
+        try:
+            hash(key)
+        except TypeError:
+            return design()
+
+        with self._lock:
+            if key in self._designs:
+                self.hits += 1
+                value = self._designs.pop(key)
+                self._designs[key] = value
+                return value
+            self.misses += 1
+
+        value = design()
+        if isinstance(value, tuple):
+            value = tuple(numpy.asarray(v) for v in value)
+            for v in value:
+                v.flags.writeable = False
+        else:
+            value = numpy.asarray(value)
+            value.flags.writeable = False
+
+        with self._lock:
+            self._designs[key] = value
+            while len(self._designs) > self.maxsize:
+                self._designs.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        """
+        Remove all designs and reset the hit and miss counters
+
+        """
+        with self._lock:
+            self._designs.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._designs)
+
+
+designcache = DesignCache()
+
+
+class LFilter(object):
+    """
+    Linear filter that keeps its state between consecutive blocks of a
+    signal
+    """
+
+    def __init__(self, b, a=1.0, axis=-1):
+        """
+        Create filter from its transfer function coefficients
+
+        Parameters
+        ----------
+        b : numpy array
+            Numerator coefficients.
+        a : numpy array
+            Denominator coefficients. Defaults to 1.0.
+        axis : int
+            The axis to filter along. Defaults to -1, use 0 for
+            `(frames, channels)` blocks read by `File.Stream`.
+
+        """
+        self.b = numpy.atleast_1d(b)
+        self.a = numpy.atleast_1d(a)
+        self.axis = axis
+        self.zi = None
+
+    def process(self, data):
+        """
+        Filter the next block of a signal
+
+        Parameters
+        ----------
+        data : numpy array
+            Input signal block.
+
+        Returns
+        -------
+        data : numpy array
+            The filtered signal block
+
+        Notes
+        -----
+
+        * Concatenating the output blocks results in the same signal as
+          filtering the concatenated input blocks in a single call.
+
+        """
+        data = numpy.asarray(data)
+
+        if self.zi is None:
+            shape = list(data.shape)
+            shape[self.axis] = max(len(self.a), len(self.b)) - 1
+            self.zi = numpy.zeros(
+                shape, dtype=numpy.result_type(self.b, self.a, data, 1.0)
+            )
+
+        data, self.zi = scipy.signal.lfilter(
+            self.b, self.a, data, axis=self.axis, zi=self.zi
+        )
+        return data
+
+    def reset(self):
+        """
+        Clear the filter state to start a new signal
+
+        """
+        self.zi = None
+
+
+class Lowpass(LFilter):
+    """
+    Stateful lowpass, see `lowpass()`
+    """
+
+    def __init__(self, cutoff, fs, coeffs=61, window='hann', axis=-1):
+        b, a = designlowpass(cutoff, fs, coeffs=coeffs, window=window)
+        LFilter.__init__(self, b, a, axis=axis)
+
+
+class Highpass(LFilter):
+    """
+    Stateful highpass, see `highpass()`
+    """
+
+    def __init__(self, cutoff, fs, coeffs=61, window='hann', axis=-1):
+        b, a = designhighpass(cutoff, fs, coeffs=coeffs, window=window)
+        LFilter.__init__(self, b, a, axis=axis)
+
+
+class SOSFilter(object):
+    """
+    Filter made of second-order sections that keeps its state between
+    consecutive blocks of a signal
+    """
+
+    def __init__(self, sos, axis=-1):
+        """
+        Create filter from its second-order sections
+
+        Parameters
+        ----------
+        sos : numpy array
+            Second-order sections, of shape `(sections, 6)`.
+        axis : int
+            The axis to filter along. Defaults to -1.
+
+        """
+        self.sos = numpy.array(sos, ndmin=2)
+        self.axis = axis
+        self.zi = None
+
+    def process(self, data):
+        """
+        Filter the next block of a signal
+
+        Parameters
+        ----------
+        data : numpy array
+            Input signal block.
+
+        Returns
+        -------
+        data : numpy array
+            The filtered signal block
+
+        """
+        data = numpy.asarray(data)
+
+        if self.zi is None:
+            shape = list(data.shape)
+            shape[self.axis] = 2
+            self.zi = numpy.zeros(
+                [self.sos.shape[0]] + shape,
+                dtype=numpy.result_type(self.sos, data, 1.0)
+            )
+
+        data, self.zi = scipy.signal.sosfilt(
+            self.sos, data, axis=self.axis, zi=self.zi
+        )
+        return data
+
+    def reset(self):
+        """
+        Clear the filter state to start a new signal
+
+        """
+        self.zi = None
+
+
+class Bandpass(object):
+    """
+    Stateful bandpass, see `bandpass()`
+    """
+
+    def __init__(self, cutoff_low, cutoff_high, fs, order=9, output='ba',
+                 axis=-1):
+        if output == 'sos':
+            self.filter = SOSFilter(designbandpass(
+                cutoff_low, cutoff_high, fs, order=order, output='sos'
+            ), axis=axis)
+        elif output == 'ba':
+            b, a = designbandpass(cutoff_low, cutoff_high, fs, order=order)
+            self.filter = LFilter(b, a, axis=axis)
+        else:
+            raise ValueError("output must be either 'ba' or 'sos'")
+
+    def process(self, data):
+        """
+        Filter the next block of a signal, see `LFilter.process()`
+
+        """
+        return self.filter.process(data)
+
+    def reset(self):
+        """
+        Clear the filter state to start a new signal
+
+        """
+        self.filter.reset()
+
+
+class Resampler(object):
+    """
+    Polyphase resampler that keeps its state between consecutive blocks of
+    a signal
+    """
+
+    def __init__(self, datafs, targetfs, compensate=False, axis=-1):
+        """
+        Create resampler for a pair of sampling frequencies
+
+        Parameters
+        ----------
+        datafs : int
+            Sampling frequency of input signal.
+        targetfs : int
+            Desired output sampling frequency.
+        compensate : boolean
+            Drop the first `delay` output samples, so that the output of
+            all blocks followed by `flush()` equals the output of
+            `resample(..., method='polyphase')`. Defaults to false.
+        axis : int
+            The axis to resample along. Defaults to -1, use 0 for
+            `(frames, channels)` blocks read by `File.Stream`.
+
+        Notes
+        -----
+
+        * The output is causal, so without `compensate` it lags the output
+          of `resample(..., method='polyphase')` by `delay` samples.
+        * Call `flush()` after the last block to receive the remaining
+          `delay` output samples.
+
+        """
+        self.up, self.down = resampleratio(datafs, targetfs)
+        taps = designresample(self.up, self.down)
+
+        # Prepend zeros so the filter delay is a whole number of output
+        # samples, just like scipy.signal.resample_poly() does
+        half = (len(taps) - 1) // 2
+        prepad = self.down - half % self.down
+        self.h = numpy.hstack((numpy.zeros(prepad), taps * self.up))
+        self.delay = (half + prepad) // self.down
+        self.compensate = compensate
+        self.axis = axis
+        self.reset()
+
+    def process(self, data):
+        """
+        Resample the next block of a signal
+
+        Parameters
+        ----------
+        data : numpy array
+            Input signal block.
+
+        Returns
+        -------
+        data : numpy array
+            The resampled signal block
+
+        """
+        data = numpy.moveaxis(numpy.asarray(data), self.axis, -1)
+        if self.history is None:
+            self.history = numpy.zeros(data.shape[:-1] + (0,))
+
+        buf = numpy.concatenate((self.history, data), axis=-1)
+        received = self.received + data.shape[-1]
+        produced = -(-received * self.up // self.down)
+
+        # history always starts at a multiple of down, so the upfirdn()
+        # output of buf is aligned to whole output samples
+        offset = self.start * self.up // self.down
+        out = scipy.signal.upfirdn(self.h, buf, self.up, self.down)
+        out = out[..., self.produced - offset:produced - offset]
+
+        # keep only the input still needed for the next output samples
+        start = max(0, (produced * self.down) // self.up -
+                    -(-len(self.h) // self.up) + 1)
+        start -= start % self.down
+
+        self.history = buf[..., start - self.start:]
+        self.start = start
+        self.received = received
+        self.produced = produced
+
+        if self.skip:
+            skip = min(self.skip, out.shape[-1])
+            out = out[..., skip:]
+            self.skip -= skip
+
+        return numpy.moveaxis(out, -1, self.axis)
+
+    def flush(self):
+        """
+        Return the output samples still delayed by the filter and clear the
+        state
+
+        Returns
+        -------
+        data : numpy array
+            The last `delay` samples of the resampled signal
+
+        """
+        if self.history is None:
+            raise ValueError("no signal has been processed")
+
+        # Feed zeros, just like resample_poly() pads the end of the signal
+        target = self.produced + self.delay
+        zeros = -(-target * self.down // self.up) - self.received
+        shape = list(self.history.shape)
+        shape[-1] = max(zeros, 0)
+
+        zeros = numpy.moveaxis(numpy.zeros(shape), -1, self.axis)
+        out = numpy.moveaxis(self.process(zeros), self.axis, -1)
+        out = out[..., :out.shape[-1] - (self.produced - target)]
+        self.reset()
+        return numpy.moveaxis(out, -1, self.axis)
+
+    def reset(self):
+        """
+        Clear the resampler state to start a new signal
+
+        """
+        self.history = None
+        self.start = 0
+        self.received = 0
+        self.produced = 0
+        self.skip = self.delay if self.compensate else 0
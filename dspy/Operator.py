@@ -3,9 +3,16 @@ General purpose operations such as RMS, db, SNR, teager etc.
 
 """
 import numpy
+import scipy.ndimage
+from . import Filter
+from . import Transform
 
+# Number of fractional delays between two samples for which kernels are
+# designed, others are interpolated between the two closest ones
+FRACTIONAL_STEPS = 256
 
-def delay(data, delay):
+
+def delay(data, delay, axis=-1, out=None, taps=16):
     """
     Shift a signal as written in mathematical notation.
 
@@ -13,8 +20,17 @@ def delay(data, delay):
     ----------
     data : numpy array
         The signal
-    delay : int
-        The delay to be applied.
+    delay : float
+        The delay to be applied. Non-integer delays are applied by
+        windowed sinc interpolation.
+    axis : int
+        The axis to shift along. Defaults to -1.
+    out : numpy array
+        Array to write the result into, of same shape as the signal. May
+        be the signal itself. Defaults to a newly allocated array.
+    taps : int
+        Length of the interpolation kernel for non-integer delays. Must be
+        even. Defaults to 16.
 
     Returns
     -------
@@ -28,19 +44,131 @@ def delay(data, delay):
 
      - x(k+1) equates to Operator.delay(x, 1)
      - x(k-1) equates to Operator.delay(x, -1)
+     - x(k+0.5) equates to Operator.delay(x, 0.5)
 
     The output signal is padded to be of same shape as input signal.
 
+    Interpolation kernels are cached in `kernelcache`, see
+    `fractionaldelay()`.
+
     """
-    if delay == 0:
+    integer = int(numpy.floor(delay))
+    fraction = delay - integer
+
+    if fraction == 0 and integer == 0 and out is None:
         return data
-    elif delay > 0:
-        return numpy.lib.pad(data, (0, delay), 'edge')[delay:]
+
+    data = numpy.asarray(data)
+
+    if fraction == 0:
+        if out is None:
+            out = numpy.empty_like(data)
+        return _shift(data, integer, axis, out)
+
+    if taps % 2 != 0 or not taps > 0:
+        raise ValueError("taps must be even and greater than zero")
+
+    if out is None:
+        out = numpy.empty(data.shape, dtype=numpy.result_type(data, 1.0))
+    elif numpy.may_share_memory(data, out):
+        data = data.copy()
+
+    if integer != 0:
+        data = _shift(data, integer, axis, numpy.empty_like(data))
+
+    # x(k + fraction) = sum_j x(k + j) h(j - fraction), where j runs from
+    # 1 - taps / 2 to taps / 2, hence the origin of -1
+    return scipy.ndimage.correlate1d(
+        data, fractionaldelay(fraction, taps), axis=axis, output=out,
+        mode='nearest', origin=-1
+    )
+
+
+def _shift(data, shift, axis, out):
+    """
+    Shift a signal by an integer number of samples along an axis, padding
+    with its edge values
+
+    """
+    x = numpy.moveaxis(data, axis, -1)
+    o = numpy.moveaxis(out, axis, -1)
+    n = x.shape[-1]
+
+    if shift >= 0:
+        shift = min(shift, n)
+        o[..., :n - shift] = x[..., shift:]
+        o[..., n - shift:] = x[..., -1:]
     else:
-        return numpy.lib.pad(data, (-delay, 0), 'edge')[:delay]
+        shift = min(-shift, n)
+        o[..., shift:] = x[..., :n - shift]
+        o[..., :shift] = x[..., :1]
+    return out
 
 
-def teager(x):
+def fractionaldelay(fraction, taps=16):
+    """
+    Calculate a Lanczos windowed sinc kernel interpolating a signal between
+    two samples
+
+    Parameters
+    ----------
+    fraction : float
+        Position between two samples, between 0 and 1.
+    taps : int
+        Length of the kernel. Must be even. Defaults to 16.
+
+    Returns
+    -------
+    kernel : numpy array
+        The read-only interpolation kernel, for offsets from
+        `1 - taps / 2` to `taps / 2` samples. It is normalized to unity
+        gain.
+
+    Notes
+    -----
+
+    * Kernels are only designed for multiples of `1 / FRACTIONAL_STEPS`
+      and cached in `kernelcache`. Other fractions linearly interpolate
+      the two closest kernels, so that continuously varying delays
+      neither design a kernel each nor evict other cached designs.
+
+    """
+    if not 0 <= fraction <= 1:
+        raise ValueError("fraction must be between 0 and 1")
+
+    position = fraction * FRACTIONAL_STEPS
+    step = min(int(position), FRACTIONAL_STEPS - 1)
+    weight = position - step
+
+    lower = _lanczoskernel(step, taps)
+    if weight == 0:
+        return lower
+
+    kernel = lower * (1 - weight)
+    kernel += _lanczoskernel(step + 1, taps) * weight
+    kernel.flags.writeable = False
+    return kernel
+
+
+def _lanczoskernel(step, taps):
+    """
+    Return the cached kernel for `fraction = step / FRACTIONAL_STEPS`, see
+    `fractionaldelay()`
+
+    """
+    def design():
+        half = taps // 2
+        t = numpy.arange(1 - half, half + 1) - float(step) / FRACTIONAL_STEPS
+        kernel = numpy.sinc(t) * numpy.sinc(t / half)
+        return kernel / kernel.sum()
+
+    return kernelcache.get(('lanczos', step, taps), design)
+
+
+kernelcache = Filter.DesignCache(maxsize=FRACTIONAL_STEPS + 1)
+
+
+def teager(x, axis=-1, out=None):
     """
     Calculate the Teager operator of a signal.
 
@@ -48,6 +176,11 @@ def teager(x):
     ----------
     data : numpy array
         The signal
+    axis : int
+        The axis to calculate the operator along. Defaults to -1.
+    out : numpy array
+        Array to write the result into, of same shape as the signal.
+        Defaults to a newly allocated array.
 
     Returns
     -------
@@ -59,15 +192,45 @@ def teager(x):
 
     Output data is padded to be of same shape as input data
 
+    For complex signals, the sum of the operator of the real and
+    imaginary parts is returned.
+
+    The data type of the output is the (real) data type of the input, so
+    float32 signals are processed in single precision.
+
     """
-    if numpy.iscomplex(x).any():
-        e = teager(numpy.real(x)) + teager(numpy.imag(x))
+    x = numpy.moveaxis(numpy.asarray(x), axis, -1)
+    if x.shape[-1] < 3:
+        raise ValueError("signal must be at least 3 samples long")
+
+    if out is None:
+        out = numpy.empty(x.shape, dtype=x.real.dtype)
     else:
-        e = x[1:-1] ** 2 - x[2:] * x[:-2]
-    return numpy.hstack((e[0], e, e[-1]))
+        out = numpy.moveaxis(out, axis, -1)
 
+    e = out[..., 1:-1]
 
-def rms(x, axis=None):
+    if numpy.iscomplexobj(x):
+        parts = (x.real, x.imag)
+    else:
+        parts = (x,)
+
+    tmp = numpy.empty_like(e)
+    for i, part in enumerate(parts):
+        if i == 0:
+            numpy.multiply(part[..., 1:-1], part[..., 1:-1], out=e)
+        else:
+            numpy.multiply(part[..., 1:-1], part[..., 1:-1], out=tmp)
+            e += tmp
+        numpy.multiply(part[..., 2:], part[..., :-2], out=tmp)
+        e -= tmp
+
+    out[..., 0] = out[..., 1]
+    out[..., -1] = out[..., -2]
+    return numpy.moveaxis(out, -1, axis)
+
+
+def rms(x, axis=None, keepdims=False):
     """
     Calculate root mean square of signal
 
@@ -75,17 +238,118 @@ def rms(x, axis=None):
     ----------
     data : numpy array
         The signal
+    axis : mixed
+        Axis or tuple of axes to calculate the RMS along. Defaults to all
+        axes.
+    keepdims : boolean
+        Keep the reduced axes with a length of one. Defaults to false.
 
     Returns
     -------
     data : float
         The RMS value
 
+    Notes
+    -----
+
+    * The squares are summed by `numpy.einsum()` in float64, without
+      creating an array of squared values.
+    * For complex signals, the squared magnitude is averaged.
+
+    """
+    return numpy.sqrt(meansquare(x, axis=axis, keepdims=keepdims))
+
+
+def meansquare(x, axis=None, keepdims=False):
+    """
+    Calculate the mean of the squared magnitude of a signal
+
+    Parameters
+    ----------
+    data : numpy array
+        The signal
+    axis : mixed
+        Axis or tuple of axes to calculate the mean along. Defaults to all
+        axes.
+    keepdims : boolean
+        Keep the reduced axes with a length of one. Defaults to false.
+
+    Returns
+    -------
+    data : float
+        The mean square value
+
+    """
+    x = numpy.asarray(x)
+
+    if axis is None:
+        axes = tuple(range(x.ndim))
+    else:
+        axes = tuple(a % x.ndim for a in numpy.atleast_1d(axis))
+
+    indices = list(range(x.ndim))
+    kept = [i for i in indices if i not in axes]
+
+    if numpy.iscomplexobj(x):
+        parts = (x.real, x.imag)
+    else:
+        parts = (x,)
+
+    total = 0
+    for part in parts:
+        total = total + numpy.einsum(
+            part, indices, part, indices, kept, dtype=numpy.float64
+        )
+
+    count = 1
+    for a in axes:
+        count *= x.shape[a]
+    total = total / count
+
+    if keepdims is True:
+        total = numpy.reshape(total, [
+            1 if i in axes else n for i, n in enumerate(x.shape)
+        ])
+    return total
+
+
+def rmsenvelope(x, size=1024, hop=512, padding='edge', axis=-1):
+    """
+    Calculate the RMS of sliding windows of a signal
+
+    Parameters
+    ----------
+    data : numpy array
+        The signal
+    size : int
+        Size of the sliding window. Defaults to 1024.
+    hop : int
+        Number of samples between the starts of two consecutive windows.
+        Defaults to 512.
+    padding : string
+        Padding mode, see `Transform.slidingwindow()`. Defaults to 'edge'.
+    axis : int
+        The axis to slide along. Defaults to -1.
+
+    Returns
+    -------
+    data : numpy array
+        The RMS values, `axis` holding one value per window
+
+    Notes
+    -----
+
+    * The RMS is calculated directly on the strided window view, no window
+      is copied.
+
     """
-    return numpy.sqrt(numpy.mean(x ** 2, axis=axis))
+    frames = Transform.slidingwindow(
+        x, size=size, hop=hop, padding=padding, axis=axis
+    )
+    return rms(frames, axis=-1)
 
 
-def snr(signal, noise):
+def snr(signal, noise, axis=None, keepdims=False):
     """
     Calculate the Signal to Noise ratio of two signals
 
@@ -95,6 +359,11 @@ def snr(signal, noise):
         The signal
     noise : numpy array
         The noise
+    axis : mixed
+        Axis or tuple of axes to calculate the SNR along. Defaults to all
+        axes.
+    keepdims : boolean
+        Keep the reduced axes with a length of one. Defaults to false.
 
     Returns
     -------
@@ -102,7 +371,11 @@ def snr(signal, noise):
         The SNR value in dB
 
     """
-    return db(rms(signal) / rms(noise), energy=True)
+    return db(
+        rms(signal, axis=axis, keepdims=keepdims) /
+        rms(noise, axis=axis, keepdims=keepdims),
+        energy=True
+    )
 
 
 def db(x, energy=False):
@@ -149,3 +422,98 @@ def idb(x, energy=False):
         return 10.0 ** (x / 10.0)
     else:
         return 10.0 ** (x / 20.0)
+
+
+class Teager(object):
+    """
+    Teager operator that keeps its state between consecutive blocks of a
+    signal
+    """
+
+    def __init__(self, axis=-1):
+        """
+        Create operator
+
+        Parameters
+        ----------
+        axis : int
+            The axis to calculate the operator along. Defaults to -1.
+
+        Notes
+        -----
+
+        * The operator of a sample depends on the following sample, so
+          output lags input by one sample. Call `flush()` after the last
+          block to get the remaining sample.
+
+        """
+        self.axis = axis
+        self.reset()
+
+    def process(self, data):
+        """
+        Calculate the operator for the next block of a signal
+
+        Parameters
+        ----------
+        data : numpy array
+            Input signal block.
+
+        Returns
+        -------
+        data : numpy array
+            The teager operator signal, up to the second to last sample
+            received so far
+
+        Notes
+        -----
+
+        * Concatenating all output blocks and the output of `flush()`
+          results in the same signal as `teager()` of the concatenated
+          input blocks.
+
+        """
+        data = numpy.moveaxis(numpy.asarray(data), self.axis, -1)
+        if self.tail is not None:
+            data = numpy.concatenate((self.tail, data), axis=-1)
+
+        # copy, as the caller may reuse its array for the next block
+        if data.shape[-1] < 3:
+            self.tail = data.copy()
+            return numpy.moveaxis(
+                numpy.zeros(data.shape[:-1] + (0,), dtype=data.real.dtype),
+                -1, self.axis
+            )
+
+        e = teager(data)[..., 1:-1]
+        if self.last is None:
+            e = numpy.concatenate((e[..., :1], e), axis=-1)
+
+        self.tail = data[..., -2:].copy()
+        self.last = e[..., -1:]
+        return numpy.moveaxis(e, -1, self.axis)
+
+    def flush(self):
+        """
+        Return the operator of the last sample and clear the state
+
+        Returns
+        -------
+        data : numpy array
+            The teager operator signal of the last sample
+
+        """
+        if self.last is None:
+            raise ValueError("signal must be at least 3 samples long")
+
+        e = self.last
+        self.reset()
+        return numpy.moveaxis(e, -1, self.axis)
+
+    def reset(self):
+        """
+        Clear the state to start a new signal
+
+        """
+        self.tail = None
+        self.last = None
@@ -2,12 +2,20 @@
 Module to generate and run signal predictors
 
 """
-import spectrum
 import scipy
+import scipy.signal
+import scipy.linalg.blas
 import numpy
+from . import Statistic
+from . import Transform
 
+try:
+    import numba
+except ImportError:
+    numba = None
 
-def levinson(correlation, order):
+
+def levinson(correlation, order, reflection=False, backend='numpy'):
     """
     Calculate the predictor coefficients for autoregressive linear prediction
     using the Levinson-Durbin algorithm
@@ -15,9 +23,15 @@ def levinson(correlation, order):
     Parameters
     ----------
     correlation : numpy array
-        The autocorrelation function of a signal.
+        The autocorrelation function of a signal. Batches of functions
+        are processed at once along the last axis.
     order : int
         The order of the prediction.
+    reflection : boolean
+        Also return the reflection coefficients. Defaults to false.
+    backend : string
+        'numpy' for the built-in implementation, 'spectrum' to use the
+        `spectrum` package, e.g. for cross-checking. Defaults to 'numpy'.
 
     Returns
     -------
@@ -26,32 +40,52 @@ def levinson(correlation, order):
     energy : float
         The estimated residual error energy after
         prediction
+    reflectioncoeffs : numpy array
+        The reflection coefficients, only if `reflection` is true
 
     Notes
     -----
 
     * The first coefficient, 1, is left out.
+    * The 'spectrum' backend only accepts one-dimensional input.
 
     """
     if not order > 0:
         raise ValueError("order must be greater than zero")
 
-    coeffs, energy, reflectioncoeffs = spectrum.LEVINSON(correlation, order)
-    energy /= correlation[0]
+    if backend == 'numpy':
+        coeffs, energy, reflectioncoeffs = _levinson(correlation, order)
+    elif backend == 'spectrum':
+        spectrum = _spectrum()
+        coeffs, energy, reflectioncoeffs = spectrum.LEVINSON(
+            correlation, order
+        )
+        energy /= correlation[0]
+    else:
+        raise ValueError("unknown backend '%s'" % backend)
+
+    if reflection:
+        return (coeffs, energy, reflectioncoeffs)
     return (coeffs, energy)
 
 
-def burg(correlation, order):
+def burg(data, order, reflection=False, backend='numpy'):
     """
     Calculate the predictor coefficients for autoregressive linear prediction
     using the Burg algorithm
 
     Parameters
     ----------
-    correlation : numpy array
-        The autocorrelation function of a signal.
+    data : numpy array
+        The signal. Batches of signals, e.g. frames, are processed at once
+        along the last axis.
     order : int
         The order of the prediction.
+    reflection : boolean
+        Also return the reflection coefficients. Defaults to false.
+    backend : string
+        'numpy' for the built-in implementation, 'spectrum' to use the
+        `spectrum` package, e.g. for cross-checking. Defaults to 'numpy'.
 
     Returns
     -------
@@ -59,33 +93,245 @@ def burg(correlation, order):
         The calculated prediction coefficients
     energy : float
         The estimated residual error energy after
-        prediction
+        prediction, relative to the signal energy
+    reflectioncoeffs : numpy array
+        The reflection coefficients, only if `reflection` is true
 
     Notes
     -----
 
     * The first coefficient, 1, is left out.
+    * Unlike `levinson()`, this function takes the signal itself, not its
+      autocorrelation function.
+    * The energy is the product of `1 - k**2` over all reflection
+      coefficients `k`, just as for `levinson()`, so both are comparable.
+    * The 'spectrum' backend only accepts one-dimensional input.
 
     """
     if not order > 0:
         raise ValueError("order must be greater than zero")
 
-    coeffs, energy, reflectioncoeffs = spectrum.arburg(correlation, order)
+    if backend == 'numpy':
+        coeffs, energy, reflectioncoeffs = _burg(data, order)
+    elif backend == 'spectrum':
+        spectrum = _spectrum()
+        coeffs, energy, reflectioncoeffs = spectrum.arburg(data, order)
+        coeffs = coeffs.real
+        reflectioncoeffs = reflectioncoeffs.real
+        energy /= numpy.mean(numpy.abs(data) ** 2)
+    else:
+        raise ValueError("unknown backend '%s'" % backend)
+
+    if reflection:
+        return (coeffs, energy, reflectioncoeffs)
+    return (coeffs, energy)
 
-    # These values are pure speculation
-    energy /= correlation[0]
-    # After this step, the curve looked like the one from levinson BEFORE
-    # THIS STEP. This means we need to divide energy by it again. Also,
-    # the values are much much lower than from levinson, the proportions
-    # are almost exactly the same. Ergo: multiply by the ratio between them.
-    energy *= (18600 / 42)
-    energy /= correlation[0]
-    energy = min(energy, 1)
 
-    return (coeffs, energy)
+def _spectrum():
+    """
+    Import the optional `spectrum` package
+
+    """
+    try:
+        import spectrum
+    except ImportError:
+        raise RuntimeError('You must have spectrum installed')
+    return spectrum
+
+
+def lpcframes(data, order, framelength=512, hop=256, window='hann',
+              method='levinson'):
+    """
+    Calculate the predictor coefficients for autoregressive linear prediction
+    of all frames of a signal at once
+
+    Parameters
+    ----------
+    data : numpy array
+        The signal. Frames are taken along the last axis, all other axes
+        are processed as a batch.
+    order : int
+        The order of the prediction.
+    framelength : int
+        Length of each frame. Defaults to 512.
+    hop : int
+        Number of samples between the starts of two consecutive frames.
+        Defaults to 256.
+    window : mixed
+        Window applied to each frame before the analysis, either the name
+        of a window accepted by `scipy.signal.get_window()` or an array of
+        length `framelength`. `None` disables windowing. Defaults to 'hann'.
+    method : string
+        'levinson' to solve the autocorrelation equations, 'burg' to use
+        the Burg algorithm on the frames. Defaults to 'levinson'.
+
+    Returns
+    -------
+    coeffs : numpy array
+        The prediction coefficients, shape `(..., frames, order)`
+    energy : numpy array
+        The residual error energy of each frame, relative to the frame
+        energy, shape `(..., frames)`
+    reflectioncoeffs : numpy array
+        The reflection coefficients, shape `(..., frames, order)`
+
+    Notes
+    -----
+
+    * The first coefficient, 1, is left out.
+    * Only frames lying completely inside the signal are analyzed, see
+      `Transform.slidingwindow()`.
+    * Silent frames result in zero coefficients and an energy of 1.
+
+    """
+    if not order > 0:
+        raise ValueError("order must be greater than zero")
+    if not order < framelength:
+        raise ValueError("order must be less than framelength")
+
+    frames = Transform.slidingwindow(
+        data, size=framelength, hop=hop, padding=None
+    )
+
+    if window is not None:
+        if isinstance(window, str):
+            window = scipy.signal.get_window(window, framelength)
+        frames = frames * numpy.asarray(
+            window, dtype=numpy.result_type(frames, numpy.float32)
+        )
+
+    if method == 'levinson':
+        correlation = Statistic.autocorr(frames, maxlag=order)
+        return _levinson(correlation, order)
+    elif method == 'burg':
+        return _burg(frames, order)
+    else:
+        raise ValueError("unknown method '%s'" % method)
+
+
+def _levinson(correlation, order):
+    """
+    Levinson-Durbin recursion over the last axis of a batch of
+    autocorrelation functions, see `levinson()`
+
+    Returns
+    -------
+    coeffs : numpy array
+        The prediction coefficients, shape `(..., order)`
+    energy : numpy array
+        The residual error energy relative to `correlation[..., 0]`
+    reflectioncoeffs : numpy array
+        The reflection coefficients, shape `(..., order)`
+
+    """
+    correlation = numpy.asarray(correlation)
+    if correlation.shape[-1] <= order:
+        raise ValueError("correlation must contain at least order + 1 lags")
+
+    dtype = numpy.result_type(correlation, numpy.float32)
+    shape = correlation.shape[:-1]
+
+    coeffs = numpy.zeros(shape + (order,), dtype=dtype)
+    reflectioncoeffs = numpy.zeros(shape + (order,), dtype=dtype)
+    previous = numpy.empty(shape + (order,), dtype=dtype)
+    error = correlation[..., 0].astype(dtype)
+    energy = numpy.ones(shape, dtype=dtype)
+    k = numpy.empty(shape, dtype=dtype)
+    valid = numpy.empty(shape, dtype=bool)
+
+    for m in range(order):
+        # Prediction error of order m at lag m + 1
+        acc = correlation[..., m + 1] + numpy.einsum(
+            '...j,...j->...', coeffs[..., :m], correlation[..., m:0:-1]
+        )
+
+        # Silent or perfectly predicted signals keep k = 0
+        numpy.greater(error, 0, out=valid)
+        k.fill(0)
+        numpy.divide(-acc, error, out=k, where=valid)
+
+        if m:
+            previous[..., :m] = coeffs[..., m - 1::-1]
+            previous[..., :m] *= k[..., None]
+            coeffs[..., :m] += previous[..., :m]
+        coeffs[..., m] = k
+        reflectioncoeffs[..., m] = k
+
+        error *= 1 - k * k
+        energy *= 1 - k * k
+
+    return (coeffs, energy[()], reflectioncoeffs)
+
+
+def _burg(data, order):
+    """
+    Burg recursion over the last axis of a batch of signals, see `burg()`
 
+    Returns
+    -------
+    coeffs : numpy array
+        The prediction coefficients, shape `(..., order)`
+    energy : numpy array
+        The residual error energy relative to the signal energy
+    reflectioncoeffs : numpy array
+        The reflection coefficients, shape `(..., order)`
 
-def rls(x, d, order=4, lamb=1.0):
+    """
+    data = numpy.asarray(data)
+    n = data.shape[-1]
+    if not order < n:
+        raise ValueError("order must be less than the signal length")
+
+    dtype = numpy.result_type(data, numpy.float32)
+    shape = data.shape[:-1]
+
+    # Forward and backward prediction errors, updated in place
+    forward = data.astype(dtype)
+    backward = data.astype(dtype)
+    work = numpy.empty(data.shape, dtype=dtype)
+
+    coeffs = numpy.zeros(shape + (order,), dtype=dtype)
+    reflectioncoeffs = numpy.zeros(shape + (order,), dtype=dtype)
+    previous = numpy.empty(shape + (order,), dtype=dtype)
+    energy = numpy.ones(shape, dtype=dtype)
+    k = numpy.empty(shape, dtype=dtype)
+    valid = numpy.empty(shape, dtype=bool)
+
+    for m in range(order):
+        # Errors of order m that overlap when predicting sample m + 1 on
+        f = forward[..., m + 1:]
+        b = backward[..., m:-1]
+        w = work[..., m + 1:]
+
+        num = numpy.einsum('...i,...i->...', f, b)
+        den = numpy.einsum('...i,...i->...', f, f) + \
+            numpy.einsum('...i,...i->...', b, b)
+
+        numpy.greater(den, 0, out=valid)
+        k.fill(0)
+        numpy.divide(-2 * num, den, out=k, where=valid)
+
+        # New backward error, shifted by one sample
+        numpy.multiply(f, k[..., None], out=w)
+        w += b
+        # New forward error
+        b *= k[..., None]
+        f += b
+        backward[..., m + 1:] = w
+
+        if m:
+            previous[..., :m] = coeffs[..., m - 1::-1]
+            previous[..., :m] *= k[..., None]
+            coeffs[..., :m] += previous[..., :m]
+        coeffs[..., m] = k
+        reflectioncoeffs[..., m] = k
+
+        energy *= 1 - k * k
+
+    return (coeffs, energy[()], reflectioncoeffs)
+
+
+def rls(x, d, order=4, lamb=1.0, method='auto'):
     """
     Recursive Least Squares Filter
 
@@ -99,6 +345,10 @@ def rls(x, d, order=4, lamb=1.0):
         Filter order.
     lamb : float
         Forgetting factor.
+    method : string
+        'numba' runs a compiled loop, 'numpy' performs BLAS calls for
+        every sample. 'auto' uses 'numba' if it is installed. Defaults to
+        'auto'.
 
     Returns
     -------
@@ -109,6 +359,12 @@ def rls(x, d, order=4, lamb=1.0):
     y : numpy array
         Estimated signal.
 
+    Notes
+    -----
+
+    * The inverse correlation matrix `P` is updated in place by a rank-1
+      update, `P -= outer(k, c P)`, no matrices are allocated per sample.
+
     References
     ----------
     .. [1] : http://www.mathworks.com/matlabcentral/fileexchange/25769-adaptive-filter
@@ -120,21 +376,97 @@ def rls(x, d, order=4, lamb=1.0):
     if not order > 0:
         raise ValueError("order must be greater than zero")
 
+    if method == 'auto':
+        method = 'numba' if _rlskernel is not None else 'numpy'
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    d = numpy.asarray(d, dtype=numpy.float64)
+
     w = numpy.zeros(order)
     e = numpy.zeros_like(x)
     y = numpy.zeros_like(x)
-    P = numpy.eye(order)
+    # Fortran order lets BLAS update P in place
+    P = numpy.asfortranarray(numpy.eye(order))
+
+    if method == 'numba':
+        if _rlskernel is None:
+            raise RuntimeError('You must have numba installed')
+        _rlskernel(x, d, order, lamb, w, P, e, y)
+    elif method == 'numpy':
+        _rlsblas(x, d, order, lamb, w, P, e, y)
+    else:
+        raise ValueError("unknown method '%s'" % method)
+
+    return (w, e, y)
+
+
+def _rlsblas(x, d, order, lamb, w, P, e, y):
+    """
+    RLS loop calling BLAS for every sample, see `rls()`
+
+    """
+    ger = scipy.linalg.blas.get_blas_funcs('ger', (P,))
+    Pi = numpy.empty(order)
+    cP = numpy.empty(order)
+    k = numpy.empty(order)
 
     for m in range(order, len(x)):
         c = x[m:m - order:-1]
-        Pi = numpy.dot(P, c)
-        k = Pi / (lamb + numpy.dot(c.T, Pi))
-        y[m] = numpy.dot(w.T, c)
+        numpy.dot(P, c, out=Pi)
+        # Equals Pi in theory, but using it keeps rounding errors from
+        # making P asymmetric and the filter unstable
+        numpy.dot(c, P, out=cP)
+        numpy.divide(Pi, lamb + numpy.dot(c, Pi), out=k)
+        y[m] = numpy.dot(w, c)
         e[m] = d[m] - y[m]
-        P = (P - numpy.dot(numpy.dot(k, c.T), P)) * (1 / lamb)
-        w = w + k * e[m]
+        P = ger(-1.0, k, cP, a=P, overwrite_a=True)
+        P *= 1 / lamb
+        k *= e[m]
+        w += k
 
-    return (w, e, y)
+
+def _rlsloop(x, d, order, lamb, w, P, e, y):
+    """
+    RLS loop over scalars, see `rls()`. Meant to be compiled by numba.
+
+    """
+    Pi = numpy.empty(order)
+    cP = numpy.empty(order)
+    k = numpy.empty(order)
+
+    for m in range(order, len(x)):
+        # c[i] = x[m - i]
+        den = lamb
+        for i in range(order):
+            acc = 0.0
+            for j in range(order):
+                acc += P[i, j] * x[m - j]
+            Pi[i] = acc
+            den += x[m - i] * acc
+        for j in range(order):
+            acc = 0.0
+            for i in range(order):
+                acc += x[m - i] * P[i, j]
+            cP[j] = acc
+
+        acc = 0.0
+        for i in range(order):
+            k[i] = Pi[i] / den
+            acc += w[i] * x[m - i]
+        y[m] = acc
+        e[m] = d[m] - acc
+
+        for j in range(order):
+            for i in range(order):
+                P[i, j] = (P[i, j] - k[i] * cP[j]) / lamb
+        for i in range(order):
+            w[i] += k[i] * e[m]
+
+
+if numba is not None:
+    _rlskernel = numba.njit(cache=True)(_rlsloop)
+else:
+    _rlskernel = None
 
 
 def predict(data, coeffs):
@@ -184,8 +516,8 @@ def predict(data, coeffs):
 
     """
     coeffs *= -1
-    pred = scipy.zeros_like(data)
-    tmp = numpy.hstack((scipy.zeros_like(coeffs), data))
+    pred = numpy.zeros_like(data)
+    tmp = numpy.hstack((numpy.zeros_like(coeffs), data))
 
     for j in range(0, coeffs.size):
         offset = coeffs.size - j - 1
@@ -3,31 +3,102 @@ Module to calculate statistic information from a signal
 
 """
 import numpy
+from . import Operator
 
+try:
+    from scipy.fft import next_fast_len
+except ImportError:
+    from scipy.fftpack import next_fast_len
 
-def autocorr(x, **kwargs):
+# Largest lag up to which autocorr(method='auto') sums lagged products
+# directly instead of using the FFT.
+DIRECT_MAXLAG = 32
+
+
+def autocorr(x, maxlag=None, method='auto', norm=None, axis=-1):
     """
     Return the autocorrelation function of a signal
 
     Parameters
     ----------
-    signal : numpy array
+    x : numpy array
         The signal to be calculated.
-
-    ... : mixed
-        All other named arguments accepted
-        by `numpy.correlate()`.
+    maxlag : int
+        The largest lag to calculate. Defaults to the signal length minus
+        one, i.e. all non-negative lags.
+    method : string
+        'direct' sums the lagged products, 'fft' multiplies in the
+        frequency domain. 'auto' uses 'direct' for up to `DIRECT_MAXLAG`
+        lags and 'fft' otherwise. Defaults to 'auto'.
+    norm : string
+        None returns the plain sums, 'biased' divides them by the signal
+        length and 'unbiased' by the number of summed products per lag.
+        Defaults to None.
+    axis : int
+        The axis to correlate along. Defaults to -1.
 
     Returns
     -------
     data : numpy array
-        The autocorrelation function
+        The autocorrelation function for lags 0 to `maxlag` along `axis`
+
+    Notes
+    -----
+
+    * The direct method needs O(n * maxlag) operations, the FFT method
+      O(n log n). Linear prediction typically only needs the first few
+      lags, where the direct method is faster.
+    * The FFT method zero-pads to the next fast length of at least
+      `n + maxlag` samples, so that lags do not wrap around.
+    * Like `numpy.correlate()`, complex signals are conjugated, i.e.
+      `data[k] = sum(x[n + k] * conj(x[n]))`.
 
     """
-    kwargs.setdefault('mode', 'full')
+    x = numpy.moveaxis(numpy.asarray(x), axis, -1)
+    # Sum in floating point, integer samples would overflow
+    x = x.astype(numpy.result_type(x, 1.0), copy=False)
+    n = x.shape[-1]
+    iscomplex = numpy.iscomplexobj(x)
+
+    if maxlag is None:
+        maxlag = n - 1
+    if not 0 <= maxlag < n:
+        raise ValueError("maxlag must be between 0 and the signal length")
+
+    if method == 'auto':
+        method = 'direct' if maxlag <= DIRECT_MAXLAG else 'fft'
+
+    if method == 'direct':
+        conj = x.conj() if iscomplex else x
+        result = numpy.empty(x.shape[:-1] + (maxlag + 1,), dtype=x.dtype)
+        for lag in range(maxlag + 1):
+            result[..., lag] = numpy.einsum(
+                '...i,...i->...', x[..., lag:], conj[..., :n - lag]
+            )
+    elif method == 'fft':
+        nfft = next_fast_len(n + maxlag)
+        if iscomplex:
+            spectrum = numpy.fft.fft(x, nfft)
+            result = numpy.fft.ifft(
+                spectrum.real ** 2 + spectrum.imag ** 2, nfft
+            )[..., :maxlag + 1]
+        else:
+            spectrum = numpy.fft.rfft(x, nfft)
+            result = numpy.fft.irfft(
+                spectrum.real ** 2 + spectrum.imag ** 2, nfft
+            )[..., :maxlag + 1]
+        result = result.astype(x.dtype, copy=False)
+    else:
+        raise ValueError("unknown method '%s'" % method)
+
+    if norm == 'biased':
+        result /= n
+    elif norm == 'unbiased':
+        result /= numpy.arange(n, n - maxlag - 1, -1)
+    elif norm is not None:
+        raise ValueError("unknown norm '%s'" % norm)
 
-    result = numpy.correlate(x, x, **kwargs)
-    return result[result.size / 2:]
+    return numpy.moveaxis(result, -1, axis)
 
 
 def quadraticdiff(a, b):
@@ -48,3 +119,141 @@ def quadraticdiff(a, b):
 
     """
     return numpy.sum((a - b) ** 2)
+
+
+class Accumulator(object):
+    """
+    Running statistics of a signal that is processed block by block
+    """
+
+    def __init__(self, axis=0, clip=1.0):
+        """
+        Create empty accumulator
+
+        Parameters
+        ----------
+        axis : int
+            The time axis of the blocks. All other axes, e.g. channels, are
+            kept separately. Defaults to 0, the layout of blocks read by
+            `File.Stream`.
+        clip : float
+            Magnitude from which on samples are counted as clipped.
+            Defaults to 1.0.
+
+        Notes
+        -----
+
+        * Mean and variance are updated using Welford's and Chan's
+          formulas, so accumulators can be merged across blocks and
+          processes without losing precision.
+        * Until samples have been added, `mean`, `minimum`, `maximum` and
+          `clipped` are None and `variance`, `rms` and `level` raise a
+          `ValueError`.
+
+        """
+        self.axis = axis
+        self.clip = clip
+        self.count = 0
+        self.mean = None
+        self.m2 = None
+        self.minimum = None
+        self.maximum = None
+        self.clipped = None
+
+    def update(self, data):
+        """
+        Add the next block of a signal
+
+        Parameters
+        ----------
+        data : numpy array
+            Input signal block.
+
+        Returns
+        -------
+        self : Accumulator
+            The accumulator itself
+
+        """
+        data = numpy.asarray(data)
+        if data.shape[self.axis] == 0:
+            return self
+
+        other = Accumulator(axis=self.axis, clip=self.clip)
+        other.count = data.shape[self.axis]
+        other.mean = numpy.mean(data, axis=self.axis, dtype=numpy.float64)
+        other.m2 = numpy.var(
+            data, axis=self.axis, dtype=numpy.float64
+        ) * other.count
+        other.minimum = numpy.min(data, axis=self.axis)
+        other.maximum = numpy.max(data, axis=self.axis)
+        other.clipped = numpy.sum(
+            numpy.abs(data) >= self.clip, axis=self.axis
+        )
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Add the statistics of another accumulator, e.g. of another part of
+        the signal processed in a different process
+
+        Parameters
+        ----------
+        other : Accumulator
+            The other accumulator.
+
+        Returns
+        -------
+        self : Accumulator
+            The accumulator itself
+
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self.mean = other.mean
+            self.m2 = other.m2
+            self.minimum = other.minimum
+            self.maximum = other.maximum
+            self.clipped = other.clipped
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+
+        self.mean = self.mean + delta * (float(other.count) / count)
+        self.m2 = self.m2 + other.m2 + \
+            delta ** 2 * (float(self.count) * other.count / count)
+        self.minimum = numpy.minimum(self.minimum, other.minimum)
+        self.maximum = numpy.maximum(self.maximum, other.maximum)
+        self.clipped = self.clipped + other.clipped
+        self.count = count
+        return self
+
+    @property
+    def variance(self):
+        """
+        Population variance of the signal
+
+        """
+        if self.count == 0:
+            raise ValueError("no samples have been accumulated")
+        return self.m2 / self.count
+
+    @property
+    def rms(self):
+        """
+        Root mean square of the signal
+
+        """
+        return numpy.sqrt(self.variance + self.mean ** 2)
+
+    @property
+    def level(self):
+        """
+        RMS level of the signal in dB, relative to full scale for
+        normalized signals
+
+        """
+        return Operator.db(self.rms, energy=True)
@@ -0,0 +1,114 @@
+"""
+Module to transform signals into other representations, such as sliding
+windows, frequency bins and rescaled spectra
+
+"""
+import numpy
+import numpy.lib.stride_tricks
+
+
+def centerpad(data, size, mode='edge', axis=-1):
+    """
+    Pad a signal so that a window of a certain size can be centered on
+    each of its samples
+
+    Parameters
+    ----------
+    data : numpy array
+        Input signal.
+    size : int
+        Size of the window.
+    mode : string
+        Padding mode as accepted by `numpy.pad()`. Defaults to 'edge'.
+    axis : int
+        The axis to pad. Defaults to -1.
+
+    Returns
+    -------
+    data : numpy array
+        The padded signal, `size - 1` samples longer than the input
+        along `axis`.
+
+    Notes
+    -----
+
+    * For even window sizes the window extends one sample further into
+      the past than into the future.
+
+    """
+    if not size > 0:
+        raise ValueError("size must be greater than zero")
+
+    data = numpy.asarray(data)
+    axis = axis % data.ndim
+
+    widths = [(0, 0)] * data.ndim
+    widths[axis] = (size // 2, size - 1 - size // 2)
+    return numpy.pad(data, widths, mode)
+
+
+def slidingwindow(data, size=11, hop=1, padding='edge', axis=-1):
+    """
+    Create a sliding window view of a signal
+
+    Parameters
+    ----------
+    data : numpy array
+        Input signal.
+    size : int
+        Size of the sliding window. Defaults to 11.
+    hop : int
+        Number of samples between the starts of two consecutive windows.
+        Defaults to 1.
+    padding : string
+        Padding mode as accepted by `numpy.pad()`, used to center one
+        window on every `hop`-th sample. `None` disables padding, so that
+        only windows lying completely inside the signal are returned.
+        Defaults to 'edge'.
+    axis : int
+        The axis to slide along. Defaults to -1.
+
+    Returns
+    -------
+    data : numpy array
+        Read-only view of the windows. `axis` is replaced by the window
+        index and a new last axis holds the samples of each window, so
+        a signal of shape `(n,)` results in shape `(frames, size)`.
+
+    Notes
+    -----
+
+    * No data is copied for the windows themselves, the result is a
+      strided view onto the (padded) signal. Padding copies the signal
+      once, which is `size - 1` samples longer than the input.
+    * With padding, the number of windows is `ceil(n / hop)`, without it
+      is `(n - size) // hop + 1`.
+    * Write to the result only after making a copy, as overlapping
+      windows share their memory.
+
+    """
+    if not size > 0:
+        raise ValueError("size must be greater than zero")
+    if not hop > 0:
+        raise ValueError("hop must be greater than zero")
+
+    data = numpy.asarray(data)
+    axis = axis % data.ndim
+
+    if padding is not None:
+        data = centerpad(data, size, mode=padding, axis=axis)
+
+    if data.shape[axis] < size:
+        raise ValueError("size must not exceed the signal length")
+
+    frames = (data.shape[axis] - size) // hop + 1
+
+    shape = data.shape[:axis] + (frames,) + data.shape[axis + 1:] + (size,)
+    strides = data.strides[:axis] + (data.strides[axis] * hop,) + \
+        data.strides[axis + 1:] + (data.strides[axis],)
+
+    view = numpy.lib.stride_tricks.as_strided(
+        data, shape=shape, strides=strides
+    )
+    view.flags.writeable = False
+    return view
@@ -0,0 +1,164 @@
+from __future__ import absolute_import
+
+import tempfile
+import shutil
+import os
+from .. import Batch
+from .. import File
+from .. import Filter
+import numpy
+
+
+def test_run():
+    indir = tempfile.mkdtemp()
+    outdir = tempfile.mkdtemp()
+    try:
+        os.mkdir(os.path.join(indir, 'sub'))
+        for name in ('a.wav', 'b.wav', os.path.join('sub', 'c.wav')):
+            File.wavwrite(
+                os.path.join(indir, name), 44100,
+                numpy.random.uniform(-1, 1, 4096)
+            )
+
+        pipeline = [
+            Batch.Step(Filter.lowpass, ratearg='fs', cutoff=1000),
+            Batch.Step(Filter.resample, ratearg='datafs', targetfs=16000,
+                       outrate=16000, method='polyphase'),
+        ]
+        results = Batch.run(
+            os.path.join(indir, '**', '*.wav'), outdir, pipeline, workers=2
+        )
+
+        outfile = os.path.join(outdir, 'sub', 'c.wav')
+        fs, data = File.wavread(outfile)
+        reference = Filter.resample(
+            Filter.lowpass(File.wavread(os.path.join(indir, 'sub', 'c.wav'))[1],
+                           1000, 44100),
+            44100, 16000, method='polyphase'
+        )
+
+        assert len(results) == 3
+        assert all(error is None for _, _, _, error in results)
+        assert fs == 16000
+        assert numpy.allclose(data, reference, atol=1e-04)
+
+        results = Batch.run(
+            os.path.join(indir, '**', '*.wav'), outdir, pipeline, workers=1
+        )
+
+        assert all(seconds is None for _, _, seconds, _ in results)
+    finally:
+        shutil.rmtree(indir)
+        shutil.rmtree(outdir)
+
+
+def test_run_stereo():
+    indir = tempfile.mkdtemp()
+    outdir = tempfile.mkdtemp()
+    try:
+        File.wavwrite(
+            os.path.join(indir, 'a.wav'), 44100,
+            numpy.random.uniform(-1, 1, (4096, 2))
+        )
+
+        pipeline = [
+            Batch.Step(Filter.lowpass, ratearg='fs', cutoff=1000),
+            Batch.Step(Filter.resample, ratearg='datafs', targetfs=16000,
+                       outrate=16000, method='polyphase'),
+        ]
+        results = Batch.run(
+            os.path.join(indir, '*.wav'), outdir, pipeline, workers=1
+        )
+
+        fs, data = File.wavread(os.path.join(outdir, 'a.wav'))
+        reference = Filter.resample(
+            Filter.lowpass(File.wavread(os.path.join(indir, 'a.wav'))[1],
+                           1000, 44100, axis=0),
+            44100, 16000, method='polyphase', axis=0
+        )
+
+        assert all(error is None for _, _, _, error in results)
+        assert data.shape == reference.shape
+        assert numpy.allclose(data, reference, atol=1e-04)
+    finally:
+        shutil.rmtree(indir)
+        shutil.rmtree(outdir)
+
+
+def test_main():
+    indir = tempfile.mkdtemp()
+    outdir = tempfile.mkdtemp()
+    try:
+        File.wavwrite(
+            os.path.join(indir, 'a.wav'), 44100,
+            numpy.random.uniform(-1, 1, 4096)
+        )
+
+        status = Batch.main([
+            os.path.join(indir, '*.wav'), outdir,
+            '--step', 'Filter.highpass', 'cutoff=100', 'fs=rate',
+            '--step', 'Filter.medianlimiter', 'size=5',
+            '--workers', '1',
+        ])
+
+        assert status == 0
+        assert os.path.exists(os.path.join(outdir, 'a.wav'))
+    finally:
+        shutil.rmtree(indir)
+        shutil.rmtree(outdir)
+
+
+def test_walkglob():
+    indir = tempfile.mkdtemp()
+    try:
+        os.makedirs(os.path.join(indir, 'sub', 'subsub'))
+        for name in ('a.wav', os.path.join('sub', 'b.wav'),
+                     os.path.join('sub', 'subsub', 'c.wav'),
+                     os.path.join('sub', 'd.txt')):
+            open(os.path.join(indir, name), 'w').close()
+
+        pattern = os.path.join(indir, '**', '*.wav')
+
+        assert sorted(map(os.path.normpath, Batch._walkglob(pattern))) == \
+            sorted(map(os.path.normpath, Batch._glob(pattern)))
+        assert len(Batch._walkglob(pattern)) == 3
+    finally:
+        shutil.rmtree(indir)
+
+
+def test_run_failed_write():
+    indir = tempfile.mkdtemp()
+    outdir = tempfile.mkdtemp()
+    wavwrite = File.wavwrite
+
+    def truncated(filename, rate, data, subtype='int16'):
+        with open(filename, 'wb') as f:
+            f.write(b'RIFF')
+        raise IOError("disk full")
+
+    try:
+        File.wavwrite(
+            os.path.join(indir, 'a.wav'), 44100,
+            numpy.random.uniform(-1, 1, 4096)
+        )
+
+        File.wavwrite = truncated
+        results = Batch.run(
+            os.path.join(indir, '*.wav'), outdir, [], workers=1
+        )
+        File.wavwrite = wavwrite
+
+        assert results[0][3] is not None
+        assert os.listdir(outdir) == []
+
+        results = Batch.run(
+            os.path.join(indir, '*.wav'), outdir, [], workers=1
+        )
+
+        assert results[0][2] is not None
+        assert results[0][3] is None
+        assert os.listdir(outdir) == ['a.wav']
+    finally:
+        File.wavwrite = wavwrite
+        shutil.rmtree(indir)
+        shutil.rmtree(outdir)
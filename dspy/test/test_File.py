@@ -4,6 +4,7 @@ import tempfile
 import os
 from .. import File
 import numpy
+import scipy.io.wavfile
 
 here = os.path.dirname(__file__)
 
@@ -30,3 +31,235 @@ def test_wavwrite_read():
 
     assert outfs == infs
     assert numpy.allclose(outsig, insig, rtol=1e-04, atol=1e-04)
+
+
+def test_wavread_mmap():
+    fs, original = File.wavread(here + '/v.wav')
+    mfs, mapped = File.wavread(here + '/v.wav', mmap=True)
+
+    assert fs == mfs
+    assert mapped.shape == original.shape
+    assert numpy.allclose(mapped[100:200], original[100:200])
+    assert numpy.allclose(numpy.asarray(mapped), original)
+
+
+def test_wavchunks():
+    fs, original = File.wavread(here + '/v.wav')
+    chunks = list(File.wavchunks(here + '/v.wav', framesize=1000))
+
+    assert all(chunk.dtype == numpy.float32 for chunk in chunks)
+    assert all(len(chunk) == 1000 for chunk in chunks[:-1])
+    assert numpy.allclose(numpy.concatenate(chunks), original)
+
+
+def test_wavread_mmap_int24():
+    outsig = numpy.random.uniform(-1, 1, (4096, 2))
+    try:
+        fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        File.wavwrite(tmpfile, 44100, outsig, subtype='int24')
+        fs, original = File.wavread(tmpfile)
+        fs, raw = File.wavread(tmpfile, dtype=None)
+        mfs, mapped = File.wavread(tmpfile, mmap=True)
+        mfs, mappedraw = File.wavread(tmpfile, mmap=True, dtype=None)
+        chunks = list(File.wavchunks(tmpfile, framesize=1000))
+
+        assert mapped.shape == original.shape
+        assert numpy.array_equal(mapped[100:200], original[100:200])
+        assert numpy.array_equal(numpy.asarray(mapped), original)
+        assert numpy.array_equal(mappedraw[:, 1], raw[:, 1])
+        assert numpy.allclose(numpy.concatenate(chunks), original)
+    finally:
+        os.remove(tmpfile)
+
+
+def test_wavread_mmap_int64():
+    raw = numpy.array([0, 2 ** 62, -2 ** 62], dtype=numpy.int64)
+    try:
+        fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        scipy.io.wavfile.write(tmpfile, 8000, raw)
+        fs, data = File.wavread(tmpfile)
+        fs, mapped = File.wavread(tmpfile, mmap=True)
+
+        assert numpy.array_equal(mapped[:], data)
+    finally:
+        os.remove(tmpfile)
+
+
+def test_wavread_uint8():
+    raw = numpy.array([0, 64, 128, 192, 255], dtype=numpy.uint8)
+    expected = (raw - 128.0) / 128
+    try:
+        fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        scipy.io.wavfile.write(tmpfile, 8000, raw)
+        fs, data = File.wavread(tmpfile)
+        fs, mapped = File.wavread(tmpfile, mmap=True)
+        stream = File.Stream(tmpfile)
+        streamed = next(stream.read(5))
+        stream.close()
+
+        assert numpy.array_equal(data, expected)
+        assert numpy.array_equal(mapped[:], expected)
+        assert numpy.array_equal(streamed, expected)
+    finally:
+        os.remove(tmpfile)
+
+
+def test_wavwrite_subtype():
+    outfs = 44100
+    outsig = numpy.random.uniform(-1, 1, (1024, 2))
+    native = {
+        'int16': numpy.int16,
+        'int24': numpy.int32,
+        'int32': numpy.int32,
+        'float32': numpy.float32,
+    }
+
+    for subtype in native:
+        try:
+            fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+            os.close(fd)
+            File.wavwrite(tmpfile, outfs, outsig, subtype=subtype)
+            infs, insig = File.wavread(tmpfile, dtype='float32')
+            infs, raw = File.wavread(tmpfile, dtype=None)
+        finally:
+            os.remove(tmpfile)
+
+        assert outfs == infs
+        assert insig.dtype == numpy.float32
+        assert raw.dtype == native[subtype]
+        assert numpy.allclose(outsig, insig, rtol=1e-04, atol=1e-04)
+
+
+def test_wavwrite_fullscale():
+    for dtype in (numpy.float32, numpy.float64):
+        outsig = numpy.array([1.0, -1.0, 0.0, 2.0, -2.0], dtype=dtype)
+
+        for subtype in ('int16', 'int24', 'int32', 'float32'):
+            try:
+                fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+                os.close(fd)
+                File.wavwrite(tmpfile, 8000, outsig, subtype=subtype)
+                infs, insig = File.wavread(tmpfile)
+            finally:
+                os.remove(tmpfile)
+
+            if subtype == 'float32':
+                assert numpy.array_equal(insig, outsig)
+            else:
+                assert numpy.allclose(
+                    insig, [1, -1, 0, 1, -1], rtol=0, atol=1e-4
+                )
+
+
+def test_stream_write_read():
+    outfs = 44100
+    outsig = numpy.random.uniform(-1, 1, (4096, 2))
+
+    for subtype in ('int16', 'int24', 'int32', 'float32'):
+        try:
+            fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+            os.close(fd)
+            stream = File.Stream(
+                tmpfile, write=True, rate=outfs, channels=2, subtype=subtype
+            )
+            stream.write(block for block in numpy.split(outsig, [10, 1000]))
+
+            infs, insig = File.wavread(tmpfile)
+            stream = File.Stream(tmpfile)
+            blocks = list(stream.read(1000))
+            stream = File.Stream(tmpfile)
+            stream.seek(2000)
+            sought = next(stream.read(10))
+            stream.close()
+        finally:
+            os.remove(tmpfile)
+
+        assert outfs == infs == stream.rate
+        assert [len(block) for block in blocks] == [1000] * 4 + [96]
+        assert numpy.allclose(outsig, insig, rtol=1e-04, atol=1e-04)
+        assert numpy.array_equal(numpy.vstack(blocks), insig)
+        assert numpy.array_equal(sought, insig[2000:2010])
+
+
+def test_stream_read_early_stop():
+    for prefetch in (0, 2):
+        stream = File.Stream(here + '/v.wav')
+        frames = stream.read(100, prefetch=prefetch)
+        next(frames)
+        frames.close()
+
+        assert stream.f.f.closed
+
+
+def test_stream_unfinished():
+    outsig = numpy.random.uniform(-1, 1, 1024)
+    try:
+        fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        stream = File.Stream(tmpfile, write=True, rate=44100, channels=1)
+        stream.write(outsig)
+        stream.f.f.flush()
+
+        insig = numpy.hstack(list(File.Stream(tmpfile).read()))
+        stream.close()
+    finally:
+        os.remove(tmpfile)
+
+    assert numpy.allclose(outsig, insig, rtol=1e-04, atol=1e-04)
+
+
+def test_stream_read_options():
+    fs, original = File.wavread(here + '/v.wav')
+    length = len(original)
+
+    stream = File.Stream(here + '/v.wav')
+    data = stream.buffer(1000)
+    frames = stream.read_into(data)
+    stream.close()
+
+    assert frames == 1000
+    assert numpy.array_equal(data, original[:1000])
+
+    blocks = list(File.Stream(here + '/v.wav').read(1000, last='truncate'))
+    assert len(blocks) == length // 1000
+
+    blocks = list(File.Stream(here + '/v.wav').read(1000, last='pad'))
+    assert all(len(block) == 1000 for block in blocks)
+    assert numpy.array_equal(numpy.hstack(blocks)[:length], original)
+    assert numpy.all(numpy.hstack(blocks)[length:] == 0)
+
+    blocks = [
+        block.copy() for block in
+        File.Stream(here + '/v.wav').read(1000, overlap=250, reuse=True)
+    ]
+    assert all(len(block) == 1000 for block in blocks[:-1])
+    for i, block in enumerate(blocks):
+        assert numpy.array_equal(block, original[i * 750:i * 750 + 1000])
+
+
+def test_stream_prefetch_writebehind():
+    fs, original = File.wavread(here + '/v.wav')
+
+    blocks = list(File.Stream(here + '/v.wav').read(1000, prefetch=4))
+    assert numpy.array_equal(numpy.hstack(blocks), original)
+
+    for block in File.Stream(here + '/v.wav').read(1000, prefetch=2):
+        break
+
+    try:
+        fd, tmpfile = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        stream = File.Stream(
+            tmpfile, write=True, rate=fs, channels=1, writebehind=4
+        )
+        stream.write(
+            File.Stream(here + '/v.wav').read(1000, reuse=True)
+        )
+        infs, insig = File.wavread(tmpfile)
+    finally:
+        os.remove(tmpfile)
+
+    assert numpy.allclose(insig, original)
@@ -15,3 +15,223 @@ def test_medianlimiter():
 def test_lowpass():
     outsig = numpy.random.uniform(0, 1, 1024)
     Filter.lowpass(outsig, 100, 44100)
+
+
+def test_localaveragecompensation():
+    outsig = numpy.random.uniform(-1, 1, 1024)
+
+    for size in (1, 10, 11, 500):
+        reference = Filter.localaveragecompensation(
+            outsig, size, method='window'
+        )
+        filtered = Filter.localaveragecompensation(outsig, size)
+
+        assert filtered.shape == outsig.shape
+        assert numpy.allclose(filtered, reference)
+
+
+def test_runningmedian():
+    outsig = numpy.random.uniform(-1, 1, 1024)
+
+    for size in (1, 4, 11):
+        reference = Filter.medianlimiter(outsig, size, method='window')
+        filtered = Filter.medianlimiter(outsig, size)
+
+        assert numpy.allclose(filtered, reference)
+
+
+def test_medianlimiter_silence():
+    outsig = numpy.random.uniform(-1, 1, 1024)
+    outsig[100:200] = 0
+
+    filtered = Filter.medianlimiter(outsig, 11)
+
+    assert numpy.all(numpy.isfinite(filtered))
+    assert numpy.all(filtered[100:200] == 0)
+
+
+def test_streaming():
+    outsig = numpy.random.uniform(-1, 1, 4096)
+    filters = [
+        (Filter.Lowpass(1000, 44100), Filter.lowpass(outsig, 1000, 44100)),
+        (Filter.Highpass(1000, 44100), Filter.highpass(outsig, 1000, 44100)),
+        (Filter.Bandpass(500, 2000, 44100),
+         Filter.bandpass(outsig, 500, 2000, 44100)),
+    ]
+
+    for f, reference in filters:
+        filtered = numpy.hstack(
+            [f.process(block) for block in numpy.split(outsig, [100, 1024])]
+        )
+
+        assert numpy.allclose(filtered, reference)
+
+
+def test_fftfilt():
+    outsig = numpy.random.uniform(-1, 1, 10000)
+
+    for coeffs in (61, 1001):
+        direct = Filter.lowpass(outsig, 1000, 44100, coeffs, method='direct')
+        fft = Filter.lowpass(outsig, 1000, 44100, coeffs, method='fft')
+        auto = Filter.highpass(outsig, 1000, 44100, coeffs)
+        reference = Filter.highpass(
+            outsig, 1000, 44100, coeffs, method='direct'
+        )
+
+        assert numpy.allclose(direct, fft)
+        assert numpy.allclose(auto, reference)
+
+
+def test_designcache():
+    Filter.designcache.clear()
+    outsig = numpy.random.uniform(-1, 1, 1024)
+
+    first = Filter.highpass(outsig, 1000, 44100)
+    second = Filter.highpass(outsig, 1000, 44100)
+    b, a = Filter.designhighpass(1000, 44100)
+
+    assert numpy.array_equal(first, second)
+    assert Filter.designcache.hits == 2
+    assert Filter.designcache.misses == 2
+    assert not b.flags.writeable
+
+    Filter.designcache.clear()
+
+    assert len(Filter.designcache) == 0
+    assert Filter.designcache.hits == 0
+
+
+def test_bandpass_sos():
+    outsig = numpy.random.uniform(-1, 1, 4096)
+    reference = Filter.bandpass(outsig, 500, 2000, 44100, order=4)
+    filtered = Filter.bandpass(outsig, 500, 2000, 44100, order=4,
+                               output='sos')
+
+    assert numpy.allclose(filtered, reference)
+
+    # The transfer function of this filter is unstable at order 9
+    filtered = Filter.bandpass(outsig, 500, 2000, 44100, output='sos')
+    f = Filter.Bandpass(500, 2000, 44100, output='sos')
+    streamed = numpy.hstack(
+        [f.process(block) for block in numpy.split(outsig, [100, 1024])]
+    )
+
+    assert numpy.abs(filtered).max() < 1
+    assert numpy.allclose(streamed, filtered)
+
+
+def test_bandpass_zerophase():
+    fs = 44100
+    t = numpy.arange(fs) / float(fs)
+    outsig = numpy.sin(2 * numpy.pi * 1000 * t)
+
+    for output in ('ba', 'sos'):
+        filtered = Filter.bandpass(
+            outsig, 500, 2000, fs, order=4, output=output, zerophase=True
+        )
+
+        assert numpy.allclose(
+            filtered[1000:-1000], outsig[1000:-1000], atol=1e-02
+        )
+
+
+def test_resample_polyphase():
+    t = numpy.arange(44100) / 44100.0
+    outsig = numpy.sin(2 * numpy.pi * 100 * t)
+
+    reference = Filter.resample(outsig, 44100, 48000)
+    resampled = Filter.resample(outsig, 44100, 48000, method='polyphase')
+
+    assert len(resampled) == 48000
+    assert numpy.allclose(
+        resampled[1000:-1000], reference[1000:-1000], atol=1e-03
+    )
+
+
+def test_resampler():
+    outsig = numpy.random.uniform(-1, 1, 10007)
+    reference = Filter.resample(outsig, 44100, 16000, method='polyphase')
+
+    r = Filter.Resampler(44100, 16000)
+    resampled = numpy.hstack(
+        [r.process(block) for block in numpy.split(outsig, [1, 100, 4096])]
+    )
+
+    assert len(resampled) == len(reference)
+    assert numpy.allclose(
+        resampled[r.delay:], reference[:len(reference) - r.delay]
+    )
+    assert numpy.allclose(
+        numpy.hstack((resampled[r.delay:], r.flush())), reference
+    )
+
+    r = Filter.Resampler(44100, 16000, compensate=True)
+    resampled = numpy.hstack(
+        [r.process(block) for block in numpy.split(outsig, [1, 100, 4096])] +
+        [r.flush()]
+    )
+
+    assert numpy.allclose(resampled, reference)
+
+
+def test_resampler_axis():
+    outsig = numpy.random.uniform(-1, 1, (1000, 2))
+    reference = Filter.resample(
+        outsig, 48000, 44100, method='polyphase', axis=0
+    )
+
+    r = Filter.Resampler(48000, 44100, compensate=True, axis=0)
+    resampled = numpy.vstack(
+        [r.process(block) for block in numpy.split(outsig, [10, 500])] +
+        [r.flush()]
+    )
+
+    assert numpy.allclose(resampled, reference)
+
+
+def test_axis():
+    outsig = numpy.random.uniform(-1, 1, (3, 2, 2048))
+    functions = [
+        lambda x, **kw: Filter.lowpass(x, 1000, 44100, **kw),
+        lambda x, **kw: Filter.highpass(x, 1000, 44100, 1001, **kw),
+        lambda x, **kw: Filter.bandpass(x, 500, 2000, 44100, output='sos',
+                                        **kw),
+        lambda x, **kw: Filter.medianlimiter(x, 4, **kw),
+        lambda x, **kw: Filter.localaveragecompensation(x, 11, **kw),
+        lambda x, **kw: Filter.resample(x, 44100, 16000,
+                                        method='polyphase', **kw),
+    ]
+
+    for f in functions:
+        batched = f(outsig)
+        transposed = f(outsig.transpose(2, 0, 1), axis=0)
+
+        assert numpy.allclose(batched[1, 0], f(outsig[1, 0]))
+        assert numpy.allclose(batched, transposed.transpose(1, 2, 0))
+
+
+def test_streaming_axis():
+    outsig = numpy.random.uniform(-1, 1, (2, 4096))
+    filters = [
+        (Filter.Lowpass(1000, 44100, axis=0),
+         Filter.lowpass(outsig, 1000, 44100)),
+        (Filter.Bandpass(500, 2000, 44100, output='sos', axis=0),
+         Filter.bandpass(outsig, 500, 2000, 44100, output='sos')),
+    ]
+
+    for f, reference in filters:
+        filtered = numpy.vstack(
+            [f.process(block) for block in numpy.split(outsig.T, [100])]
+        )
+
+        assert numpy.allclose(filtered.T, reference)
+
+    r = Filter.Resampler(44100, 16000, axis=0)
+    resampled = numpy.vstack(
+        [r.process(block) for block in numpy.split(outsig.T, [100])]
+    )
+    reference = Filter.resample(outsig, 44100, 16000, method='polyphase')
+
+    assert numpy.allclose(
+        resampled[r.delay:].T, reference[:, :reference.shape[1] - r.delay]
+    )
@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 
 from .. import Operator
+from .. import Filter
+from .. import Transform
 import numpy
 
 
@@ -10,3 +12,116 @@ def tests_teager():
 
     assert original.shape == energy.shape
     assert numpy.allclose(energy, numpy.ones(10))
+
+
+def test_teager_complex():
+    original = numpy.random.randn(100) + 1j * numpy.random.randn(100)
+    energy = Operator.teager(original)
+    reference = Operator.teager(original.real) + \
+        Operator.teager(original.imag)
+
+    assert numpy.allclose(energy, reference)
+
+
+def test_teager_axis():
+    original = numpy.random.randn(3, 100).astype(numpy.float32)
+    out = numpy.empty((100, 3), dtype=numpy.float32)
+    energy = Operator.teager(original.T, axis=0, out=out)
+
+    assert energy.dtype == numpy.float32
+    assert numpy.may_share_memory(energy, out)
+    for channel in range(3):
+        assert numpy.allclose(
+            energy[:, channel], Operator.teager(original[channel])
+        )
+
+
+def test_teager_streaming():
+    original = numpy.random.randn(2, 1000)
+    t = Operator.Teager()
+    blocks = [t.process(block)
+              for block in numpy.split(original, [1, 2, 10, 500], axis=1)]
+    energy = numpy.hstack(blocks + [t.flush()])
+
+    assert numpy.allclose(energy, Operator.teager(original))
+
+
+def test_delay():
+    original = numpy.arange(10)
+
+    assert numpy.array_equal(
+        Operator.delay(original, 2), [2, 3, 4, 5, 6, 7, 8, 9, 9, 9]
+    )
+    assert numpy.array_equal(
+        Operator.delay(original, -2), [0, 0, 0, 1, 2, 3, 4, 5, 6, 7]
+    )
+
+    out = numpy.tile(original, (2, 1)).T
+    Operator.delay(out, 1, axis=0, out=out)
+
+    assert numpy.array_equal(out[:, 1], Operator.delay(original, 1))
+
+
+def test_delay_fractional():
+    k = numpy.arange(1000)
+    original = numpy.sin(0.1 * k)
+
+    for delay in (0.25, 0.5, -1.3, 3.7):
+        delayed = Operator.delay(original, delay)
+
+        assert numpy.allclose(
+            delayed[20:-20], numpy.sin(0.1 * (k + delay))[20:-20], atol=1e-3
+        )
+
+
+def test_fractionaldelay_cache():
+    Filter.designcache.clear()
+    Operator.kernelcache.clear()
+    Filter.lowpass(numpy.zeros(100), 1000, 44100)
+
+    for fraction in numpy.random.uniform(0, 1, 1000):
+        kernel = Operator.fractionaldelay(fraction)
+        half = 8
+        t = numpy.arange(1 - half, half + 1) - fraction
+        exact = numpy.sinc(t) * numpy.sinc(t / half)
+
+        assert numpy.allclose(kernel, exact / exact.sum(), atol=1e-4)
+
+    assert len(Filter.designcache) == 1
+    assert len(Operator.kernelcache) <= Operator.FRACTIONAL_STEPS + 1
+
+    Filter.lowpass(numpy.zeros(100), 1000, 44100)
+    assert Filter.designcache.hits == 1
+
+
+def test_rms():
+    original = numpy.random.randn(3, 4, 100)
+
+    assert numpy.allclose(
+        Operator.rms(original), numpy.sqrt(numpy.mean(original ** 2))
+    )
+    assert numpy.allclose(
+        Operator.rms(original, axis=-1),
+        numpy.sqrt(numpy.mean(original ** 2, axis=-1))
+    )
+    assert numpy.allclose(
+        Operator.rms(original, axis=(0, 2), keepdims=True),
+        numpy.sqrt(numpy.mean(original ** 2, axis=(0, 2), keepdims=True))
+    )
+    assert numpy.allclose(
+        Operator.rms(original + 1j * original),
+        numpy.sqrt(2) * Operator.rms(original)
+    )
+    assert numpy.allclose(
+        Operator.snr(original, 0.1 * original, axis=-1), 20
+    )
+
+
+def test_rmsenvelope():
+    original = numpy.random.randn(2, 1000)
+    envelope = Operator.rmsenvelope(original, size=100, hop=50, axis=1)
+    windows = Transform.slidingwindow(original, 100, 50, axis=1)
+    reference = numpy.sqrt(numpy.mean(windows ** 2, axis=-1))
+
+    assert envelope.shape == (2, 20)
+    assert numpy.allclose(envelope, reference)
@@ -14,9 +14,72 @@ def test_levinson():
 
 
 def test_burg():
-    outsig = numpy.random.uniform(0, 1, 1024)
+    outsig = scipy.signal.lfilter(
+        [1], [1, -0.9, 0.4], numpy.random.randn(8192)
+    )
+    coeffs, pe, reflectioncoeffs = Predictor.burg(outsig, 4, reflection=True)
+    expected, expected_pe = Predictor.levinson(Statistic.autocorr(outsig), 4)
+
+    assert numpy.allclose(coeffs, [-0.9, 0.4, 0, 0], atol=0.05)
+    assert numpy.allclose(coeffs, expected, atol=0.01)
+    assert numpy.allclose(pe, expected_pe, rtol=0.01)
+    assert numpy.allclose(pe, numpy.prod(1 - reflectioncoeffs ** 2))
+
+
+def test_burg_batch():
+    outsig = numpy.random.randn(3, 256)
+    coeffs, pe = Predictor.burg(outsig, 4)
+
+    assert coeffs.shape == (3, 4)
+    assert pe.shape == (3,)
+    for frame in range(3):
+        expected, expected_pe = Predictor.burg(outsig[frame], 4)
+        assert numpy.allclose(coeffs[frame], expected)
+        assert numpy.allclose(pe[frame], expected_pe)
+
+    coeffs, pe, reflectioncoeffs = Predictor.lpcframes(
+        outsig[0], 4, framelength=128, hop=64, window=None, method='burg'
+    )
+    expected, expected_pe = Predictor.burg(outsig[0, 64:192], 4)
+
+    assert coeffs.shape == (3, 4)
+    assert numpy.allclose(coeffs[1], expected)
+    assert numpy.allclose(pe[1], expected_pe)
+
+
+def test_levinson_backends():
+    outsig = scipy.signal.lfilter(
+        [1], [1, -0.9, 0.4], numpy.random.randn(1024)
+    )
     corr = Statistic.autocorr(outsig)
-    Predictor.levinson(corr, 4)
+
+    coeffs, pe, reflectioncoeffs = Predictor.levinson(
+        corr, 8, reflection=True
+    )
+    expected = Predictor.levinson(corr, 8, reflection=True, backend='spectrum')
+
+    assert numpy.allclose(coeffs, expected[0])
+    assert numpy.allclose(pe, expected[1])
+    assert numpy.allclose(reflectioncoeffs, expected[2])
+
+    coeffs, pe, reflectioncoeffs = Predictor.levinson(
+        corr.astype(numpy.float32), 8, reflection=True
+    )
+    assert coeffs.dtype == numpy.float32
+    assert numpy.allclose(coeffs, expected[0], atol=1e-4)
+
+
+def test_burg_backends():
+    outsig = scipy.signal.lfilter(
+        [1], [1, -0.9, 0.4], numpy.random.randn(1024)
+    )
+
+    coeffs, pe, reflectioncoeffs = Predictor.burg(outsig, 8, reflection=True)
+    expected = Predictor.burg(outsig, 8, reflection=True, backend='spectrum')
+
+    assert numpy.allclose(coeffs, expected[0])
+    assert numpy.allclose(pe, expected[1])
+    assert numpy.allclose(reflectioncoeffs, expected[2])
 
 
 def test_prediction():
@@ -35,3 +98,51 @@ def test_rls():
     lam = 0.99
     w, e, y = Predictor.rls(x, d, 32, lam)
     assert numpy.allclose(b, w, rtol=1e-01, atol=1e-01)
+
+
+def test_lpcframes():
+    outsig = scipy.signal.lfilter(
+        [1], [1, -0.9, 0.4], numpy.random.randn(2, 4096)
+    )
+    coeffs, energy, reflectioncoeffs = Predictor.lpcframes(
+        outsig, 8, framelength=512, hop=256
+    )
+
+    assert coeffs.shape == (2, 15, 8)
+    assert energy.shape == (2, 15)
+    assert reflectioncoeffs.shape == (2, 15, 8)
+
+    frame = outsig[1, 768:1280] * scipy.signal.get_window('hann', 512)
+    corr = Statistic.autocorr(frame, maxlag=8)
+    expected, pe = Predictor.levinson(corr, 8)
+
+    assert numpy.allclose(coeffs[1, 3], expected)
+    assert numpy.allclose(energy[1, 3], pe)
+    assert numpy.allclose(energy, numpy.prod(1 - reflectioncoeffs ** 2, -1))
+
+
+def test_lpcframes_silence():
+    coeffs, energy, reflectioncoeffs = Predictor.lpcframes(
+        numpy.zeros(1024, dtype=numpy.float32), 4
+    )
+
+    assert coeffs.dtype == numpy.float32
+    assert numpy.all(coeffs == 0)
+    assert numpy.all(energy == 1)
+
+
+def test_rls_loop():
+    x = numpy.random.randn(500)
+    d = scipy.signal.lfilter(scipy.signal.firwin(8, 0.5), 1, x)
+    w, e, y = Predictor.rls(x, d, 8, 0.99, method='numpy')
+
+    # The loop numba compiles, run as plain Python
+    w2 = numpy.zeros(8)
+    e2 = numpy.zeros_like(x)
+    y2 = numpy.zeros_like(x)
+    P = numpy.eye(8)
+    Predictor._rlsloop(x, d, 8, 0.99, w2, P, e2, y2)
+
+    assert numpy.allclose(w, w2)
+    assert numpy.allclose(e, e2)
+    assert numpy.allclose(y, y2)
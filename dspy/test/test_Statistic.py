@@ -14,4 +14,96 @@ def test_quadraticdiff():
 
 def test_autocorr():
     outsig = numpy.random.uniform(0, 1, 1024)
-    Statistic.autocorr(outsig)
+    corr = Statistic.autocorr(outsig)
+
+    assert corr.shape == (1024,)
+    assert numpy.allclose(
+        corr, numpy.correlate(outsig, outsig, mode='full')[1023:]
+    )
+
+
+def test_autocorr_methods():
+    outsig = numpy.random.uniform(-1, 1, (3, 1000))
+
+    direct = Statistic.autocorr(outsig, maxlag=40, method='direct')
+    fft = Statistic.autocorr(outsig, maxlag=40, method='fft')
+
+    assert direct.shape == (3, 41)
+    assert numpy.allclose(direct, fft)
+    assert numpy.allclose(
+        direct[1], numpy.correlate(outsig[1], outsig[1], mode='full')[999:1040]
+    )
+
+
+def test_autocorr_int():
+    outsig = numpy.random.randint(-32768, 32767, 4096).astype(numpy.int16)
+    expected = numpy.correlate(
+        outsig.astype(numpy.float64), outsig.astype(numpy.float64),
+        mode='full'
+    )[4095:4099]
+
+    for method in ('direct', 'fft'):
+        assert numpy.allclose(
+            Statistic.autocorr(outsig, maxlag=3, method=method), expected
+        )
+
+
+def test_autocorr_complex():
+    outsig = numpy.random.randn(500) + 1j * numpy.random.randn(500)
+    expected = numpy.correlate(outsig, outsig, mode='full')[499:]
+
+    for method in ('direct', 'fft'):
+        assert numpy.allclose(
+            Statistic.autocorr(outsig, method=method), expected
+        )
+
+
+def test_autocorr_norm_axis():
+    outsig = numpy.random.uniform(-1, 1, (1000, 2))
+    corr = Statistic.autocorr(outsig, maxlag=10, axis=0)
+
+    assert corr.shape == (11, 2)
+    assert numpy.allclose(
+        Statistic.autocorr(outsig, maxlag=10, norm='biased', axis=0),
+        corr / 1000
+    )
+    assert numpy.allclose(
+        Statistic.autocorr(outsig, maxlag=10, norm='unbiased', axis=0),
+        corr / numpy.arange(1000, 989, -1)[:, None]
+    )
+
+
+def test_accumulator():
+    outsig = numpy.random.uniform(-1.1, 1, (10000, 2)) + 0.1
+
+    first = Statistic.Accumulator()
+    for block in numpy.split(outsig[:5000], [1, 1000]):
+        first.update(block)
+    second = Statistic.Accumulator().update(outsig[5000:])
+    total = first.merge(second)
+
+    assert total.count == 10000
+    assert numpy.allclose(total.mean, numpy.mean(outsig, axis=0))
+    assert numpy.allclose(total.variance, numpy.var(outsig, axis=0))
+    assert numpy.allclose(
+        total.rms, numpy.sqrt(numpy.mean(outsig ** 2, axis=0))
+    )
+    assert numpy.allclose(total.level, 20 * numpy.log10(total.rms))
+    assert numpy.array_equal(total.minimum, numpy.min(outsig, axis=0))
+    assert numpy.array_equal(total.maximum, numpy.max(outsig, axis=0))
+    assert numpy.array_equal(
+        total.clipped, numpy.sum(numpy.abs(outsig) >= 1, axis=0)
+    )
+
+
+def test_accumulator_empty():
+    acc = Statistic.Accumulator().update(numpy.zeros((0, 2)))
+
+    assert acc.count == 0
+    for name in ('variance', 'rms', 'level'):
+        try:
+            getattr(acc, name)
+        except ValueError:
+            pass
+        else:
+            assert False
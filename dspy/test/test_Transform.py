@@ -0,0 +1,36 @@
+from __future__ import absolute_import
+
+from .. import Transform
+import numpy
+
+
+def test_slidingwindow():
+    original = numpy.arange(10.0)
+    windows = Transform.slidingwindow(original, size=3)
+
+    assert windows.shape == (10, 3)
+    assert numpy.array_equal(windows[0], [0, 0, 1])
+    assert numpy.array_equal(windows[5], [4, 5, 6])
+    assert numpy.array_equal(windows[-1], [8, 9, 9])
+
+
+def test_slidingwindow_nopadding():
+    original = numpy.arange(10.0)
+    windows = Transform.slidingwindow(original, size=4, hop=3, padding=None)
+
+    assert windows.shape == (3, 4)
+    assert numpy.may_share_memory(windows, original)
+    assert numpy.array_equal(windows[:, 0], [0, 3, 6])
+
+
+def test_slidingwindow_axis():
+    original = numpy.arange(20.0).reshape(2, 10)
+    windows = Transform.slidingwindow(original, size=5, hop=2, axis=1)
+    reference = numpy.array([
+        Transform.slidingwindow(channel, size=5, hop=2)
+        for channel in original
+    ])
+
+    assert windows.shape == (2, 5, 5)
+    assert numpy.array_equal(windows, reference)
+    assert not windows.flags.writeable
@@ -58,12 +58,10 @@ setup(
     author='Nils Werner',
     tests_require=['Nose'],
     install_requires=[
-        'SciPy>=0.9.0',
-        'NumPy>=1.6.0',
+        'SciPy>=0.18.0',
+        'NumPy>=1.11.0',
         'matplotlib>=1.0.0',
         'pyaudio>=0.2.4',
-        'spectrum>=0.5.6',
-        'scikits.audiolab>=0.11.0',
         'sphinx',
         'sphinx_rtd_theme'
     ],
@@ -89,6 +87,12 @@ setup(
     ],
     extras_require={
         'testing': ['Nose'],
+        'soundfile': ['soundfile>=0.8.0'],
+        'spectrum': ['spectrum>=0.5.6'],
+        'numba': ['numba'],
+    },
+    entry_points={
+        'console_scripts': ['dspy-batch = dspy.Batch:main'],
     },
     # Register custom commands
     cmdclass={